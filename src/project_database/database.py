@@ -1,11 +1,12 @@
 """Database initialization and session management."""
 import os
+from functools import lru_cache
 from pathlib import Path
-from dotenv import load_dotenv
-from sqlalchemy import create_engine
+from sqlalchemy import URL, Engine, and_, create_engine, delete, exists, inspect, make_url, or_
+from sqlalchemy.pool import StaticPool
 from sqlalchemy.orm import sessionmaker, Session
 
-from project_database.models import Base
+from project_database.models import Base, Project
 
 # Global engine and session maker
 _engine = None
@@ -16,7 +17,9 @@ def init_database() -> None:
     """Initialize the database from environment configuration.
 
     Reads DATABASE_PATH from environment variables, creates the database file
-    and all tables defined in the models.
+    and all tables defined in the models. DATABASE_PATH is either a path to a
+    SQLite file or a full SQLAlchemy database URL. Calling it again with the
+    same DATABASE_PATH reuses the existing engine and its connection pool.
 
     Note: Call load_dotenv() before this function to load from .env file.
     """
@@ -27,22 +30,78 @@ def init_database() -> None:
     if not db_path:
         raise ValueError("DATABASE_PATH not found in environment")
 
-    # Create parent directory if it doesn't exist
-    db_path_obj = Path(db_path)
-    db_path_obj.parent.mkdir(parents=True, exist_ok=True)
+    if "://" in db_path:
+        url = db_path
+    else:
+        # Create parent directory if it doesn't exist
+        db_path_obj = Path(db_path)
+        db_path_obj.parent.mkdir(parents=True, exist_ok=True)
+        url = f"sqlite:///{db_path}"
 
-    # Close existing engine if any
-    if _engine is not None:
-        _engine.dispose()
-
-    # Create engine and tables
-    _engine = create_engine(f"sqlite:///{db_path}")
-    Base.metadata.create_all(_engine)
+    _engine = _engine_for(url)
 
     # Create session maker
     _SessionMaker = sessionmaker(bind=_engine)
 
 
+@lru_cache(maxsize=8)
+def _engine_for(url: str) -> Engine:
+    """Create an engine for url, with all tables and indexes, once per URL."""
+    parsed = make_url(url)
+    connect_args = {"check_same_thread": False} if parsed.get_backend_name() == "sqlite" else {}
+    if _is_sqlite_memory(parsed):
+        # An in-memory database lives on its connection, so every session shares one
+        engine = create_engine(url, poolclass=StaticPool, connect_args=connect_args)
+    else:
+        # Create engine with a pool of reusable connections, and tables
+        engine = create_engine(
+            url,
+            pool_size=10,
+            max_overflow=20,
+            pool_timeout=30,
+            pool_pre_ping=True,
+            pool_recycle=1800,
+            connect_args=connect_args
+        )
+    Base.metadata.create_all(engine)
+
+    # Databases from before the unique path index may hold duplicates that would block it
+    existing_indexes = {index["name"] for index in inspect(engine).get_indexes(Project.__tablename__)}
+    if "ix_projects_path" not in existing_indexes:
+        _remove_duplicate_paths(engine)
+
+    # create_all skips indexes on tables that already exist, so add any missing ones
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(engine, checkfirst=True)
+
+    return engine
+
+
+def _remove_duplicate_paths(engine: Engine) -> None:
+    """Delete all but the most recently updated project row for each path."""
+    projects = Project.__table__
+    newer = projects.alias("newer")
+    has_newer = exists().where(
+        newer.c.path == projects.c.path,
+        or_(
+            newer.c.updated_at > projects.c.updated_at,
+            and_(newer.c.updated_at == projects.c.updated_at, newer.c.id > projects.c.id)
+        )
+    )
+    with engine.begin() as connection:
+        removed = connection.execute(delete(projects).where(has_newer)).rowcount
+    if removed:
+        print(f"Removed {removed} duplicate project rows before adding the unique path index")
+
+
+def _is_sqlite_memory(url: URL) -> bool:
+    """Return True if url names an in-memory SQLite database."""
+    if url.get_backend_name() != "sqlite":
+        return False
+    return url.database in (None, "", ":memory:") or url.query.get("mode") == "memory"
+
+
 def get_session() -> Session:
     """Get a database session.
 
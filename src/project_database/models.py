@@ -1,6 +1,6 @@
 """SQLAlchemy models for the project database."""
 from datetime import datetime
-from sqlalchemy import Boolean, DateTime, String, func
+from sqlalchemy import Boolean, DateTime, Index, String, func
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
 
 
@@ -25,6 +25,10 @@ class Project(Base):
         last_file_modified: Most recent file modification time in project directory (optional)
     """
     __tablename__ = "projects"
+    __table_args__ = (
+        # One row per project directory; also the conflict target for upserts
+        Index("ix_projects_path", "path", unique=True),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True)
     name: Mapped[str] = mapped_column(String(255), nullable=False)
@@ -0,0 +1,73 @@
+"""On-disk cache of CodeAnalyzer file analyses, one entry per file path.
+
+Each entry records a digest of the source it was computed from, and is
+overwritten when the file changes, so the cache grows with the number of
+files rather than the number of edits. The cache is only an optimisation:
+unreadable entries are treated as misses and failed writes are logged and
+ignored.
+"""
+
+import hashlib
+import logging
+import os
+import pickle
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+# Bump when the structure of analyze_file results changes, to ignore old entries
+ANALYZER_VERSION = 2
+
+
+def source_digest(source: bytes) -> str:
+    """Digest of analyzer version and source bytes, stored with each entry."""
+    digest = hashlib.sha256(f"{ANALYZER_VERSION}\0".encode('utf-8'))
+    digest.update(source)
+    return digest.hexdigest()
+
+
+def _entry_path(cache_dir: str, filepath: str) -> Path:
+    """Path of the single cache entry for filepath."""
+    name = hashlib.sha256(os.path.abspath(filepath).encode('utf-8')).hexdigest()
+    return Path(cache_dir) / f"{name}.pkl"
+
+
+def load(cache_dir: str, filepath: str, digest: str) -> Optional[Dict[str, Any]]:
+    """Return the cached analysis of filepath if it was made from source with digest, else None."""
+    try:
+        with open(_entry_path(cache_dir, filepath), 'rb') as f:
+            stored_digest, file_info = pickle.load(f)
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        logger.debug("Ignoring unreadable AST cache entry for %s: %s", filepath, e)
+        return None
+    return file_info if stored_digest == digest else None
+
+
+def store(cache_dir: str, filepath: str, digest: str, file_info: Dict[str, Any]) -> None:
+    """
+    Store the analysis of filepath, replacing any earlier entry for it.
+
+    The entry is written to a temporary file and renamed into place, so
+    worker processes storing concurrently never expose a partial entry.
+    Failures, such as a full disk or read-only directory, are logged and
+    otherwise ignored.
+    """
+    tmp_path = None
+    try:
+        directory = Path(cache_dir)
+        directory.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+        with os.fdopen(fd, 'wb') as f:
+            pickle.dump((digest, file_info), f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, _entry_path(cache_dir, filepath))
+    except Exception as e:
+        logger.warning("Could not write AST cache entry for %s: %s", filepath, e)
+        if tmp_path is not None:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
@@ -0,0 +1,245 @@
+"""Caching adapters that wrap other adapters to avoid repeated work."""
+
+import hashlib
+import shelve
+import threading
+import time
+from pathlib import Path
+from typing import List, Optional, Tuple
+import numpy as np
+from ..ports import LLMPort, EmbeddingPort
+
+
+class CachedLLMAdapter(LLMPort):
+    """LLM adapter that stores another adapter's responses on disk.
+
+    Responses are keyed by model, prompts and options, expire after
+    ttl_seconds and are evicted least-recently-used beyond max_entries.
+    If an embedder is given, a miss also checks recent entries with the
+    same model, system prompt and options for a user prompt whose
+    embedding is at least similarity_threshold cosine-similar.
+    """
+
+    def __init__(
+        self,
+        llm: LLMPort,
+        cache_path: str,
+        model: str,
+        ttl_seconds: float = 3600,
+        max_entries: int = 500,
+        embedder: Optional[EmbeddingPort] = None,
+        similarity_threshold: float = 0.97,
+        semantic_window: int = 50
+    ):
+        """
+        Initialize LLM response cache.
+
+        Args:
+            llm: Adapter used to generate responses missing from the cache
+            cache_path: Path of the cache file (parent directories are created)
+            model: LLM model name, included in cache keys
+            ttl_seconds: Age after which a cached response is ignored (default: 1 hour)
+            max_entries: Maximum number of cached responses (default: 500)
+            embedder: Optional embedder enabling similarity matching of user prompts
+            similarity_threshold: Minimum cosine similarity for a similarity hit
+            semantic_window: Number of most recently used entries checked for similarity
+        """
+        self.llm = llm
+        self.cache_path = str(cache_path)
+        self.model = model
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.embedder = embedder
+        self.similarity_threshold = similarity_threshold
+        self.semantic_window = semantic_window
+        self._lock = threading.Lock()
+        Path(self.cache_path).parent.mkdir(parents=True, exist_ok=True)
+
+    def generate(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        **options
+    ) -> str:
+        """
+        Return cached response, generating it with the wrapped LLM on a miss.
+
+        Args:
+            system_prompt: System/role instruction for the LLM
+            user_prompt: User's prompt/question
+            **options: Model-specific options, included in cache keys
+
+        Returns:
+            Generated text response
+        """
+        context = self._hash(self.model, system_prompt, repr(sorted(options.items())))
+        key = self._hash(context, user_prompt)
+        now = time.time()
+
+        with self._lock, shelve.open(self.cache_path) as cache:
+            entry = cache.get(key)
+            if entry is not None and not self._expired(entry, now):
+                return self._touch(cache, key, entry, now)
+
+        embedding = None
+        if self.embedder is not None:
+            embedding = self.embedder.embed(user_prompt)
+            with self._lock, shelve.open(self.cache_path) as cache:
+                similar_key = self._find_similar(cache, context, embedding, now)
+                if similar_key is not None:
+                    return self._touch(cache, similar_key, cache[similar_key], now)
+
+        value = self.llm.generate(system_prompt, user_prompt, **options)
+
+        with self._lock, shelve.open(self.cache_path) as cache:
+            cache[key] = {
+                'value': value,
+                'created_at': now,
+                'last_used': now,
+                'context': context,
+                'embedding': embedding
+            }
+            self._evict(cache, now)
+
+        return value
+
+    def _find_similar(self, cache, context: str, embedding: List[float], now: float) -> Optional[str]:
+        """Find the most recent compatible entry with a similar user prompt."""
+        candidates = sorted(
+            (
+                (entry['last_used'], key, entry['embedding'])
+                for key, entry in cache.items()
+                if entry['context'] == context
+                and entry['embedding'] is not None
+                and not self._expired(entry, now)
+            ),
+            reverse=True
+        )[:self.semantic_window]
+
+        if not candidates:
+            return None
+
+        similarities = _cosine_similarities(embedding, [other for _, _, other in candidates])
+        hits = np.flatnonzero(similarities >= self.similarity_threshold)
+        # Candidates are most recent first, so the first hit is the most recent match
+        return candidates[hits[0]][1] if len(hits) else None
+
+    def _evict(self, cache, now: float) -> None:
+        """Drop expired entries, then least recently used entries over max_entries."""
+        entries = sorted((entry['last_used'], key, entry) for key, entry in cache.items())
+        live = []
+        for last_used, key, entry in entries:
+            if self._expired(entry, now):
+                del cache[key]
+            else:
+                live.append(key)
+        for key in live[:max(0, len(live) - self.max_entries)]:
+            del cache[key]
+
+    def _expired(self, entry: dict, now: float) -> bool:
+        """Check whether a cache entry is older than the TTL."""
+        return now - entry['created_at'] > self.ttl_seconds
+
+    def _touch(self, cache, key: str, entry: dict, now: float) -> str:
+        """Mark entry as recently used and return its value."""
+        entry['last_used'] = now
+        cache[key] = entry
+        return entry['value']
+
+    @staticmethod
+    def _hash(*parts: str) -> str:
+        """Hash the given strings into a cache key."""
+        return hashlib.sha256('\0'.join(parts).encode('utf-8')).hexdigest()
+
+
+class EmbeddingCache(EmbeddingPort):
+    """Embedding adapter that stores another adapter's vectors on disk.
+
+    Embeddings are a pure function of (model, text), so unchanged chunks
+    are served from the cache on re-runs and only new text is sent to the
+    wrapped embedder. Vectors are stored quantized (float16, or int8 with a
+    per-vector scale) and always returned as they decode from the cache,
+    so a text gets the same vector whether or not it was a cache hit.
+    """
+
+    def __init__(
+        self,
+        embedder: EmbeddingPort,
+        cache_path: str,
+        model: str,
+        dtype: str = 'float16'
+    ):
+        """
+        Initialize embedding cache.
+
+        Args:
+            embedder: Adapter used to embed texts missing from the cache
+            cache_path: Path of the cache file (parent directories are created)
+            model: Embedding model name, included in cache keys
+            dtype: Storage precision, 'float16' or 'int8' (default: float16)
+        """
+        if dtype not in ('float16', 'int8'):
+            raise ValueError(f"Unsupported embedding cache dtype: {dtype}")
+        self.embedder = embedder
+        self.cache_path = str(cache_path)
+        self.model = model
+        self.dtype = dtype
+        self._lock = threading.Lock()
+        Path(self.cache_path).parent.mkdir(parents=True, exist_ok=True)
+
+    def embed(self, text: str) -> List[float]:
+        """Return cached embedding, embedding the text on a cache miss."""
+        return self.embed_batch([text])[0]
+
+    def embed_batch(self, texts: List[str]) -> List[List[float]]:
+        """
+        Return cached embeddings, embedding only the cache misses.
+
+        Args:
+            texts: Texts to embed
+
+        Returns:
+            Embedding vectors, in the same order as texts
+        """
+        keys = [self._key(text) for text in texts]
+
+        with self._lock, shelve.open(self.cache_path) as cache:
+            stored = [cache.get(key) for key in keys]
+
+        missing = [i for i, entry in enumerate(stored) if entry is None]
+        if missing:
+            new_vectors = self.embedder.embed_batch([texts[i] for i in missing])
+            with self._lock, shelve.open(self.cache_path) as cache:
+                for i, vector in zip(missing, new_vectors):
+                    stored[i] = _quantize(vector, self.dtype)
+                    cache[keys[i]] = stored[i]
+
+        return [_dequantize(entry) for entry in stored]
+
+    def _key(self, text: str) -> str:
+        """Build cache key from model name and text."""
+        return hashlib.sha256(f"{self.model}\0{text}".encode('utf-8')).hexdigest()
+
+
+def _quantize(vector: List[float], dtype: str) -> Tuple[str, float, bytes]:
+    """Pack a vector as (dtype, scale, raw bytes) for storage."""
+    array = np.asarray(vector, dtype=np.float32)
+    if dtype == 'int8':
+        scale = float(np.abs(array).max()) / 127 or 1.0
+        return dtype, scale, np.round(array / scale).astype(np.int8).tobytes()
+    return dtype, 1.0, array.astype(np.float16).tobytes()
+
+
+def _dequantize(entry: Tuple[str, float, bytes]) -> List[float]:
+    """Unpack a stored vector back to a list of floats."""
+    dtype, scale, data = entry
+    array = np.frombuffer(data, dtype=dtype).astype(np.float32)
+    return (array * scale).tolist()
+
+
+def _cosine_similarities(query: List[float], vectors: List[List[float]]) -> np.ndarray:
+    """Cosine similarity of query to each vector (0.0 where either is all zeros)."""
+    matrix = np.asarray(vectors, dtype=np.float64)
+    query = np.asarray(query, dtype=np.float64)
+    norms = np.linalg.norm(matrix, axis=1) * np.linalg.norm(query)
+    return np.divide(matrix @ query, norms, out=np.zeros(len(matrix)), where=norms != 0)
@@ -1,6 +1,7 @@
 """ChromaDB adapter for vector storage."""
 
 import chromadb
+import numpy as np
 from typing import List, Dict, Any
 from ..ports import VectorStorePort
 from ..config import Config
@@ -14,9 +15,10 @@ class ChromaDBAdapter(VectorStorePort):
         Initialize ChromaDB adapter.
 
         Args:
-            config: Configuration with db_path
+            config: Configuration with db_path and add_batch_size
         """
         self.client = chromadb.PersistentClient(path=config.db_path)
+        self.batch_size = config.add_batch_size
 
     def create_collection(self, name: str) -> chromadb.Collection:
         """
@@ -28,13 +30,8 @@ class ChromaDBAdapter(VectorStorePort):
         Returns:
             ChromaDB collection object
         """
-        # Delete existing collection if it exists
-        try:
-            self.client.delete_collection(name)
-        except:
-            pass
-
-        collection = self.client.create_collection(
+        # Keep existing chunks so unchanged code is not re-indexed
+        collection = self.client.get_or_create_collection(
             name=name,
             metadata={"description": f"Code chunks for {name}"}
         )
@@ -52,6 +49,10 @@ class ChromaDBAdapter(VectorStorePort):
         """
         Add document chunks to ChromaDB collection.
 
+        Chunks are written in sub-batches of at most batch_size to keep
+        each request (and the server's memory use) bounded. Chunks whose
+        ID is already stored are skipped.
+
         Args:
             collection: ChromaDB collection
             documents: Document texts
@@ -59,12 +60,40 @@ class ChromaDBAdapter(VectorStorePort):
             metadatas: Metadata dicts
             ids: Unique IDs
         """
-        collection.add(
-            documents=documents,
-            embeddings=embeddings,
-            metadatas=metadatas,
-            ids=ids
-        )
+        # One contiguous float32 matrix, the layout Chroma's HNSW index stores
+        vectors = np.asarray(embeddings, dtype=np.float32)
+        for start in range(0, len(ids), self.batch_size):
+            end = start + self.batch_size
+            # Chroma's add leaves already stored IDs untouched, so no lookup is needed
+            collection.add(
+                documents=documents[start:end],
+                embeddings=vectors[start:end],
+                metadatas=metadatas[start:end],
+                ids=ids[start:end]
+            )
+
+    def get_ids(self, collection: chromadb.Collection) -> List[str]:
+        """
+        List IDs of all chunks in a ChromaDB collection.
+
+        Args:
+            collection: ChromaDB collection
+
+        Returns:
+            Chunk IDs
+        """
+        return collection.get(include=[])['ids']
+
+    def delete_chunks(self, collection: chromadb.Collection, ids: List[str]) -> None:
+        """
+        Remove chunks from a ChromaDB collection.
+
+        Args:
+            collection: ChromaDB collection
+            ids: IDs of chunks to remove
+        """
+        for start in range(0, len(ids), self.batch_size):
+            collection.delete(ids=ids[start:start + self.batch_size])
 
     def query(
         self,
@@ -1,6 +1,7 @@
 """Mock adapters for testing without external dependencies."""
 
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Tuple
+import numpy as np
 from ..ports import LLMPort, EmbeddingPort, VectorStorePort
 
 
@@ -57,30 +58,68 @@ main()
 class MockEmbeddingAdapter(EmbeddingPort):
     """Mock embedding adapter that returns fake vectors."""
 
-    def __init__(self, embedding_dim: int = 384):
+    def __init__(self, embedding_dim: int = 384, dtype: str = 'float64'):
         """
         Initialize mock embedder.
 
         Args:
             embedding_dim: Dimension of embedding vectors
+            dtype: Precision of the fake vectors: 'float64' (default), 'float32',
+                'float16', or 'int8' (quantized with a per-vector scale). embed
+                returns the values as Python floats at that precision.
         """
+        if dtype not in ('float64', 'float32', 'float16', 'int8'):
+            raise ValueError(f"Unsupported mock embedding dtype: {dtype}")
         self.embedding_dim = embedding_dim
+        self.dtype = dtype
+        self._offsets = np.arange(embedding_dim, dtype=np.int64)
+        self._cache: Dict[str, List[float]] = {}
         self.call_count = 0
+        self.batch_count = 0
         self.embedded_texts = []
 
     def embed(self, text: str) -> List[float]:
         """Return a fake embedding based on text hash."""
         self.call_count += 1
         self.embedded_texts.append(text)
+        return self._fake_embedding(text)
 
-        # Generate deterministic fake embedding based on text
-        # Use hash for reproducibility
-        text_hash = hash(text)
-        fake_embedding = [
-            float((text_hash + i) % 1000) / 1000.0
-            for i in range(self.embedding_dim)
-        ]
-        return fake_embedding
+    def embed_batch(self, texts: List[str]) -> List[List[float]]:
+        """Return fake embeddings for all texts, counted as one batch call."""
+        self.batch_count += 1
+        self.embedded_texts.extend(texts)
+        return [self._fake_embedding(text) for text in texts]
+
+    def embed_array(self, text: str) -> np.ndarray:
+        """
+        Return the fake embedding as an array of the adapter's dtype.
+
+        For 'int8' these are the quantized codes; embed returns them
+        multiplied back by the vector's scale. Not counted as a call.
+        """
+        return self._quantized(text)[0]
+
+    def _fake_embedding(self, text: str) -> List[float]:
+        """Generate deterministic fake embedding based on text hash, memoized per text."""
+        embedding = self._cache.get(text)
+        if embedding is None:
+            array, scale = self._quantized(text)
+            if self.dtype == 'int8':
+                embedding = (array * scale).tolist()
+            else:
+                embedding = array.tolist()
+            self._cache[text] = embedding
+        # Copy, so callers modifying a vector cannot change later results
+        return list(embedding)
+
+    def _quantized(self, text: str) -> Tuple[np.ndarray, float]:
+        """Compute the fake vector at the adapter's dtype, with its int8 scale (else 1.0)."""
+        # Element i is ((hash + i) % 1000) / 1000, computed for all i at once
+        values = ((hash(text) % 1000 + self._offsets) % 1000) / 1000.0
+        if self.dtype == 'int8':
+            scale = float(values.max()) / 127 or 1.0
+            return np.round(values / scale).astype(np.int8), scale
+        return values.astype(self.dtype), 1.0
 
 
 class MockVectorStoreAdapter(VectorStorePort):
@@ -96,9 +135,10 @@ class MockVectorStoreAdapter(VectorStorePort):
         if name not in self.collections:
             self.collections[name] = {
                 'documents': [],
-                'embeddings': [],
+                'embeddings': None,
                 'metadatas': [],
-                'ids': []
+                'ids': [],
+                'normalized': None
             }
         self.current_collection = name
         return name
@@ -111,12 +151,46 @@ class MockVectorStoreAdapter(VectorStorePort):
         metadatas: List[Dict[str, Any]],
         ids: List[str]
     ) -> None:
-        """Add chunks to in-memory store."""
+        """
+        Add chunks to in-memory store, skipping IDs already stored.
+
+        Embeddings are kept as one float32 matrix, one row per chunk.
+        """
         coll = self.collections[collection]
-        coll['documents'].extend(documents)
-        coll['embeddings'].extend(embeddings)
-        coll['metadatas'].extend(metadatas)
-        coll['ids'].extend(ids)
+        existing = set(coll['ids'])
+        new = []
+        for i, chunk_id in enumerate(ids):
+            if chunk_id in existing:
+                continue
+            coll['documents'].append(documents[i])
+            coll['metadatas'].append(metadatas[i])
+            coll['ids'].append(chunk_id)
+            existing.add(chunk_id)
+            new.append(i)
+        if not new:
+            return
+
+        rows = np.asarray(embeddings, dtype=np.float32)[new]
+        if coll['embeddings'] is None:
+            coll['embeddings'] = rows
+        else:
+            coll['embeddings'] = np.vstack([coll['embeddings'], rows])
+        coll['normalized'] = None
+
+    def get_ids(self, collection: Any) -> List[str]:
+        """List IDs stored in in-memory collection."""
+        return list(self.collections[collection]['ids'])
+
+    def delete_chunks(self, collection: Any, ids: List[str]) -> None:
+        """Remove chunks from in-memory collection."""
+        coll = self.collections[collection]
+        removed = set(ids)
+        keep = [i for i, chunk_id in enumerate(coll['ids']) if chunk_id not in removed]
+        for field in ('documents', 'metadatas', 'ids'):
+            coll[field] = [coll[field][i] for i in keep]
+        if coll['embeddings'] is not None:
+            coll['embeddings'] = coll['embeddings'][keep]
+        coll['normalized'] = None
 
     def query(
         self,
@@ -124,6 +198,26 @@ class MockVectorStoreAdapter(VectorStorePort):
         query_embedding: List[float],
         n_results: int
     ) -> List[str]:
-        """Return first n documents (simple mock - no actual similarity search)."""
+        """Return the n documents most cosine-similar to the query, best first."""
         coll = self.collections[collection]
-        return coll['documents'][:n_results]
\ No newline at end of file
+        n_results = min(n_results, len(coll['documents']))
+        if n_results == 0:
+            return []
+
+        if coll['normalized'] is None:
+            coll['normalized'] = _normalize_rows(coll['embeddings'])
+
+        query = _normalize_rows(np.asarray([query_embedding], dtype=np.float32))[0]
+        scores = coll['normalized'] @ query
+
+        top = np.argpartition(-scores, n_results - 1)[:n_results]
+        # Best score first; ties keep insertion order
+        top = top[np.lexsort((top, -scores[top]))]
+        return [coll['documents'][i] for i in top]
+
+
+def _normalize_rows(matrix: np.ndarray) -> np.ndarray:
+    """Scale each row to unit length, leaving all-zero rows as they are."""
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return matrix / norms
\ No newline at end of file
@@ -1,11 +1,18 @@
 """Ollama adapters for LLM and embeddings."""
 
 import ollama
-from typing import List
+from functools import lru_cache
+from typing import Iterator, List, Optional
 from ..ports import LLMPort, EmbeddingPort
 from ..config import Config
 
 
+@lru_cache(maxsize=4)
+def _client_for(host: str) -> ollama.Client:
+    """Return a client for host, shared so adapters reuse one connection pool."""
+    return ollama.Client(host=host)
+
+
 class OllamaLLMAdapter(LLMPort):
     """Adapter for Ollama LLM text generation."""
 
@@ -16,13 +23,14 @@ class OllamaLLMAdapter(LLMPort):
         Args:
             config: Configuration with ollama_host and llm_model
         """
-        self.client = ollama.Client(host=config.ollama_host)
+        self.client = _client_for(config.ollama_host)
         self.model = config.llm_model
 
     def generate(
         self,
         system_prompt: str,
         user_prompt: str,
+        stop: Optional[str] = None,
         **options
     ) -> str:
         """
@@ -31,12 +39,41 @@ class OllamaLLMAdapter(LLMPort):
         Args:
             system_prompt: System/role instruction
             user_prompt: User's prompt/question
+            stop: Optional string at which to end the response (not included)
             **options: Ollama options (temperature, num_predict, etc.)
 
         Returns:
             Generated text
         """
-        response = self.client.chat(
+        return ''.join(self.stream_generate(system_prompt, user_prompt, stop=stop, **options))
+
+    def stream_generate(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        stop: Optional[str] = None,
+        **options
+    ) -> Iterator[str]:
+        """
+        Generate text using Ollama, yielding pieces as the model produces them.
+
+        The response is read from Ollama's streaming endpoint. When stop
+        appears the stream is closed at once, so the server stops decoding;
+        closing this generator early has the same effect.
+
+        Args:
+            system_prompt: System/role instruction
+            user_prompt: User's prompt/question
+            stop: Optional string at which to end the response (not included)
+            **options: Ollama options (temperature, num_predict, etc.)
+
+        Yields:
+            Successive pieces of the generated text
+        """
+        if stop:
+            options.setdefault('stop', [stop])
+
+        stream = self.client.chat(
             model=self.model,
             messages=[
                 {
@@ -48,10 +85,34 @@ class OllamaLLMAdapter(LLMPort):
                     'content': user_prompt
                 }
             ],
-            options=options
+            options=options,
+            stream=True
         )
 
-        return response['message']['content']
+        try:
+            if not stop:
+                for part in stream:
+                    if part['message']['content']:
+                        yield part['message']['content']
+                return
+
+            # Hold back a possible partial stop string until the next piece arrives
+            pending = ''
+            for part in stream:
+                pending += part['message']['content']
+                end = pending.find(stop)
+                if end != -1:
+                    if end:
+                        yield pending[:end]
+                    return
+                ready = len(pending) - len(stop) + 1
+                if ready > 0:
+                    yield pending[:ready]
+                    pending = pending[ready:]
+            if pending:
+                yield pending
+        finally:
+            stream.close()
 
 
 class OllamaEmbeddingAdapter(EmbeddingPort):
@@ -64,7 +125,7 @@ class OllamaEmbeddingAdapter(EmbeddingPort):
         Args:
             config: Configuration with ollama_host and embed_model
         """
-        self.client = ollama.Client(host=config.ollama_host)
+        self.client = _client_for(config.ollama_host)
         self.model = config.embed_model
 
     def embed(self, text: str) -> List[float]:
@@ -77,9 +138,35 @@ class OllamaEmbeddingAdapter(EmbeddingPort):
         Returns:
             Embedding vector
         """
-        response = self.client.embeddings(
+        response = self.client.embed(
             model=self.model,
-            prompt=text
+            input=text
         )
 
-        return response['embedding']
\ No newline at end of file
+        return response['embeddings'][0]
+
+    def embed_batch(self, texts: List[str]) -> List[List[float]]:
+        """
+        Generate embedding vectors for several texts in one request.
+
+        Falls back to embedding each text separately if the batched
+        request is rejected, so one bad input does not fail the batch.
+
+        Args:
+            texts: Texts to embed
+
+        Returns:
+            Embedding vectors, in the same order as texts
+        """
+        if not texts:
+            return []
+
+        try:
+            response = self.client.embed(
+                model=self.model,
+                input=texts
+            )
+        except ollama.ResponseError:
+            return [self.embed(text) for text in texts]
+
+        return response['embeddings']
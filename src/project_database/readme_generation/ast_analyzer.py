@@ -1,12 +1,38 @@
 """AST-based code analyzer for extracting structural information from Python files."""
 
 import ast
+import inspect
+import os
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import ExitStack
+from functools import partial
+from itertools import chain
 from pathlib import Path
-from typing import Dict, List, Any
+from typing import Dict, Iterator, List, Any, Optional, Tuple
+from . import _ast_cache
+
+# Directories that never contain project source
+SKIP_DIRS = frozenset({'.venv', 'venv', '__pycache__', '.git', 'node_modules', '.tox'})
 
 
 class CodeAnalyzer:
-    """Extract structural information from Python files using AST."""
+    """Extract structural information from Python files using AST.
+
+    Results of analyze_project are cached per file, keyed by modification
+    time and size, so re-analyzing a project only parses changed files.
+    With a cache_dir, file analyses are also stored on disk keyed by source
+    content, so they survive across analyzer instances and processes.
+    """
+
+    def __init__(self, cache_dir: Optional[str] = None):
+        """
+        Initialize analyzer with an empty per-file cache.
+
+        Args:
+            cache_dir: Optional directory for the on-disk analysis cache
+        """
+        self.cache_dir = str(cache_dir) if cache_dir is not None else None
+        self._cache: Dict[str, Tuple[Tuple[int, int], Dict[str, Any]]] = {}
 
     def analyze_file(self, filepath: str) -> Dict[str, Any]:
         """
@@ -16,56 +42,63 @@ class CodeAnalyzer:
             filepath: Path to the Python file to analyze
 
         Returns:
-            Dictionary containing functions, classes, imports, docstring, and source code.
-            If syntax error occurs, returns dict with 'error' key.
+            Dictionary containing functions, classes, imports and docstring. The
+            source itself is not kept; CodeChunker reads it again when needed.
+            If syntax error occurs, returns dict with 'error' key. With a
+            cache_dir, a stored analysis of identical source is reused.
         """
-        with open(filepath, 'r', encoding='utf-8') as f:
-            try:
-                source = f.read()
-                tree = ast.parse(source)
-            except SyntaxError:
-                return {'error': 'syntax_error', 'filepath': filepath}
+        with open(filepath, 'rb') as f:
+            source = f.read()
+
+        if self.cache_dir is None:
+            return self._analyze_source(filepath, source)
+
+        digest = _ast_cache.source_digest(source)
+        file_info = _ast_cache.load(self.cache_dir, filepath, digest)
+        if file_info is None:
+            file_info = self._analyze_source(filepath, source)
+            _ast_cache.store(self.cache_dir, filepath, digest, file_info)
+        return file_info
+
+    def _analyze_source(self, filepath: str, source: bytes) -> Dict[str, Any]:
+        """Parse source read from filepath and extract metadata."""
+        # Let ast.parse decode the bytes itself, honouring PEP 263 coding lines
+        try:
+            tree = ast.parse(source, filename=filepath)
+        except (SyntaxError, ValueError):
+            return {'error': 'syntax_error', 'filepath': filepath}
+
+        functions, classes, imports = self._extract_all(tree)
 
         return {
             'filepath': filepath,
-            'functions': self._extract_functions(tree),
-            'classes': self._extract_classes(tree),
-            'imports': self._extract_imports(tree),
-            'module_docstring': ast.get_docstring(tree),
-            'source': source
+            'functions': functions,
+            'classes': classes,
+            'imports': imports,
+            'module_docstring': _docstring(tree)
         }
 
-    def _extract_functions(self, tree: ast.AST) -> List[Dict]:
-        """Extract function definitions with signatures."""
+    def _extract_all(self, tree: ast.Module) -> Tuple[List[Dict], List[Dict], List[str]]:
+        """
+        Extract function definitions, class definitions and imports.
+
+        Functions and classes are found among module-level statements and
+        class bodies only, so functions nested inside other functions are not
+        reported. Imports are collected from the whole tree, including those
+        under try/except ImportError, if TYPE_CHECKING and function bodies.
+        """
         functions = []
-        for node in ast.walk(tree):
-            if isinstance(node, ast.FunctionDef):
-                functions.append({
-                    'name': node.name,
-                    'args': [arg.arg for arg in node.args.args],
-                    'docstring': ast.get_docstring(node) or '',
-                    'lineno': node.lineno,
-                    'is_async': isinstance(node, ast.AsyncFunctionDef)
-                })
-        return functions
-
-    def _extract_classes(self, tree: ast.AST) -> List[Dict]:
-        """Extract class definitions."""
         classes = []
-        for node in ast.walk(tree):
-            if isinstance(node, ast.ClassDef):
-                methods = [m for m in node.body if isinstance(m, ast.FunctionDef)]
-                classes.append({
-                    'name': node.name,
-                    'bases': [self._get_name(base) for base in node.bases],
-                    'methods': [m.name for m in methods],
-                    'docstring': ast.get_docstring(node) or '',
-                    'lineno': node.lineno
-                })
-        return classes
-
-    def _extract_imports(self, tree: ast.AST) -> List[str]:
-        """Extract import statements."""
+        for node in tree.body:
+            if isinstance(node, ast.FunctionDef):
+                functions.append(self._function_info(node))
+            elif isinstance(node, ast.ClassDef):
+                classes.append(self._class_info(node))
+                functions.extend(
+                    self._function_info(member) for member in node.body
+                    if isinstance(member, ast.FunctionDef)
+                )
+
         imports = []
         for node in ast.walk(tree):
             if isinstance(node, ast.Import):
@@ -75,44 +108,150 @@ class CodeAnalyzer:
                 module = node.module or ''
                 for alias in node.names:
                     imports.append(f"{module}.{alias.name}" if module else alias.name)
-        return imports
+        return functions, classes, imports
+
+    def _function_info(self, node: ast.FunctionDef) -> Dict[str, Any]:
+        """Extract function definition with signature."""
+        return {
+            'name': node.name,
+            'args': [arg.arg for arg in node.args.args],
+            'docstring': _docstring(node) or '',
+            'lineno': node.lineno,
+            'end_lineno': node.end_lineno,
+            'is_async': isinstance(node, ast.AsyncFunctionDef)
+        }
+
+    def _class_info(self, node: ast.ClassDef) -> Dict[str, Any]:
+        """Extract class definition."""
+        methods = [m for m in node.body if isinstance(m, ast.FunctionDef)]
+        return {
+            'name': node.name,
+            'bases': [self._get_name(base) for base in node.bases],
+            'methods': [m.name for m in methods],
+            'docstring': _docstring(node) or '',
+            'lineno': node.lineno,
+            'end_lineno': node.end_lineno
+        }
 
     def _get_name(self, node: ast.AST) -> str:
         """Extract name from AST node."""
-        if isinstance(node, ast.Name):
-            return node.id
-        elif isinstance(node, ast.Attribute):
-            return f"{self._get_name(node.value)}.{node.attr}"
-        return str(node)
+        parts = []
+        while isinstance(node, ast.Attribute):
+            parts.append(node.attr)
+            node = node.value
+        parts.append(node.id if isinstance(node, ast.Name) else str(node))
+        return '.'.join(reversed(parts))
 
-    def analyze_project(self, project_path: str) -> Dict[str, Any]:
+    def analyze_project(self, project_path: str, max_workers: Optional[int] = None) -> Dict[str, Any]:
         """
         Analyze all Python files in a project.
 
+        Files are parsed in parallel worker processes, since parsing is
+        CPU-bound and independent per file. Files unchanged since a previous
+        call on this analyzer are not parsed again.
+
         Args:
             project_path: Path to the project directory
+            max_workers: Maximum number of worker processes (default: CPU count,
+                1 analyzes in this process)
 
         Returns:
             Dictionary containing project metadata and analysis of all files
         """
         project_path = Path(project_path)
-        files = []
 
-        for py_file in project_path.rglob('*.py'):
-            # Skip common non-project files
-            if any(skip in str(py_file) for skip in ['.venv', 'venv', '__pycache__', '.git']):
-                continue
-
-            file_info = self.analyze_file(str(py_file))
-            if 'error' not in file_info:
-                files.append(file_info)
+        files = list(self.iter_project(str(project_path), max_workers=max_workers))
 
         return {
             'project_path': str(project_path),
             'project_name': project_path.name,
             'file_count': len(files),
             'files': files,
-            'all_imports': list(set(sum([f['imports'] for f in files], []))),
+            'all_imports': sorted(set(chain.from_iterable(f['imports'] for f in files))),
             'total_functions': sum(len(f['functions']) for f in files),
             'total_classes': sum(len(f['classes']) for f in files)
-        }
\ No newline at end of file
+        }
+
+    def iter_project(self, project_path: str, max_workers: Optional[int] = None) -> Iterator[Dict[str, Any]]:
+        """
+        Yield the analysis of each Python file in a project as it becomes ready.
+
+        All stale files are submitted to the worker processes up front, so
+        parsing continues while the caller processes earlier files. Files
+        are yielded sorted by path, whatever order the workers finish in;
+        files with syntax errors are skipped.
+
+        Args:
+            project_path: Path to the project directory
+            max_workers: Maximum number of worker processes (default: CPU count,
+                1 analyzes in this process)
+
+        Yields:
+            File analysis dictionaries, as returned by analyze_file
+        """
+        file_paths = sorted(_iter_py_files(str(project_path)))
+
+        signatures = {}
+        stale_paths = []
+        for path in file_paths:
+            stat = os.stat(path)
+            signature = (stat.st_mtime_ns, stat.st_size)
+            cached = self._cache.get(path)
+            if cached is None or cached[0] != signature:
+                signatures[path] = signature
+                stale_paths.append(path)
+
+        with ExitStack() as stack:
+            if max_workers == 1 or len(stale_paths) < 2:
+                analyzed = map(self.analyze_file, stale_paths)
+            else:
+                workers = max_workers or os.cpu_count() or 1
+                executor = stack.enter_context(ProcessPoolExecutor(max_workers=workers))
+                # About four chunks per worker balances load against pickling overhead
+                analyzed = executor.map(
+                    partial(_analyze_file, cache_dir=self.cache_dir), stale_paths,
+                    chunksize=max(1, len(stale_paths) // (4 * workers))
+                )
+
+            for path in file_paths:
+                if path in signatures:
+                    file_info = next(analyzed)
+                    if 'error' in file_info:
+                        continue
+                    self._cache[path] = (signatures[path], file_info)
+                else:
+                    file_info = self._cache[path][1]
+                yield file_info
+
+
+def _docstring(node: ast.AST) -> Optional[str]:
+    """Return the cleaned docstring of a module, class or function node, if any."""
+    first = node.body[0] if node.body else None
+    if (isinstance(first, ast.Expr)
+            and isinstance(first.value, ast.Constant)
+            and isinstance(first.value.value, str)):
+        return inspect.cleandoc(first.value.value)
+    return None
+
+
+def _iter_py_files(root: str) -> Iterator[str]:
+    """Yield paths of Python files under root, not descending into SKIP_DIRS."""
+    stack = [root]
+    while stack:
+        directory = stack.pop()
+        try:
+            entries = os.scandir(directory)
+        except OSError:
+            continue
+        with entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name not in SKIP_DIRS:
+                        stack.append(entry.path)
+                elif entry.name.endswith('.py'):
+                    yield entry.path
+
+
+def _analyze_file(filepath: str, cache_dir: Optional[str] = None) -> Dict[str, Any]:
+    """Analyze one file in a worker process."""
+    return CodeAnalyzer(cache_dir=cache_dir).analyze_file(filepath)
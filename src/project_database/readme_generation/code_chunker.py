@@ -1,5 +1,6 @@
 """Code chunker for splitting code at function/class boundaries."""
 
+from itertools import chain
 from pathlib import Path
 from typing import Dict, List, Any
 
@@ -11,6 +12,8 @@ class CodeChunker:
         """
         Create chunks from analyzed file.
 
+        The file's source is read once, here, rather than kept in file_info.
+
         Args:
             file_info: Dictionary from CodeAnalyzer.analyze_file()
 
@@ -32,41 +35,56 @@ class CodeChunker:
             }
             chunks.append(chunk)
 
-        # Function chunks
-        source_lines = file_info['source'].splitlines()
-        for func in file_info.get('functions', []):
-            chunk = {
+        # Function and class chunks, in source order
+        definitions = sorted(
+            [('function', func) for func in file_info.get('functions', [])]
+            + [('class', cls) for cls in file_info.get('classes', [])],
+            key=lambda definition: definition[1]['lineno']
+        )
+        if not definitions:
+            return chunks
+
+        with open(file_info['filepath'], 'rb') as f:
+            source_lines = f.read().decode('utf-8', errors='replace').splitlines()
+
+        for kind, definition in definitions:
+            if kind == 'function':
+                chunks.append(self._function_chunk(file_info['filepath'], source_lines, definition))
+            else:
+                chunks.append(self._class_chunk(file_info['filepath'], source_lines, definition))
+
+        return chunks
+
+    def _function_chunk(self, filepath: str, source_lines: List[str], func: Dict) -> Dict[str, Any]:
+        """Build chunk for a function definition."""
+        return {
+            'type': 'function',
+            'filepath': filepath,
+            'name': func['name'],
+            'content': self._extract_function_source(source_lines, func),
+            'metadata': {
                 'type': 'function',
-                'filepath': file_info['filepath'],
                 'name': func['name'],
-                'content': self._extract_function_source(source_lines, func),
-                'metadata': {
-                    'type': 'function',
-                    'name': func['name'],
-                    'args': func['args'],
-                    'docstring': func.get('docstring', '')
-                }
+                'args': func['args'],
+                'docstring': func.get('docstring', '')
             }
-            chunks.append(chunk)
-
-        # Class chunks
-        for cls in file_info.get('classes', []):
-            chunk = {
+        }
+
+    def _class_chunk(self, filepath: str, source_lines: List[str], cls: Dict) -> Dict[str, Any]:
+        """Build chunk for a class definition."""
+        return {
+            'type': 'class',
+            'filepath': filepath,
+            'name': cls['name'],
+            'content': self._extract_class_source(source_lines, cls),
+            'metadata': {
                 'type': 'class',
-                'filepath': file_info['filepath'],
                 'name': cls['name'],
-                'content': self._extract_class_source(source_lines, cls),
-                'metadata': {
-                    'type': 'class',
-                    'name': cls['name'],
-                    'methods': cls['methods'],
-                    'bases': cls['bases'],
-                    'docstring': cls.get('docstring', '')
-                }
+                'methods': cls['methods'],
+                'bases': cls['bases'],
+                'docstring': cls.get('docstring', '')
             }
-            chunks.append(chunk)
-
-        return chunks
+        }
 
     def _build_module_chunk(self, file_info: Dict[str, Any]) -> str:
         """Build module-level chunk content."""
@@ -85,9 +103,8 @@ class CodeChunker:
 
     def _extract_function_source(self, source_lines: List[str], func: Dict) -> str:
         """Extract function source from original file."""
-        # Simple heuristic: take 20 lines from function start
         start = func['lineno'] - 1
-        end = min(start + 20, len(source_lines))
+        end = func['end_lineno']
 
         lines = source_lines[start:end]
 
@@ -97,9 +114,8 @@ class CodeChunker:
 
     def _extract_class_source(self, source_lines: List[str], cls: Dict) -> str:
         """Extract class source from original file."""
-        # Simple heuristic: take 30 lines from class start
         start = cls['lineno'] - 1
-        end = min(start + 30, len(source_lines))
+        end = cls['end_lineno']
 
         lines = source_lines[start:end]
 
@@ -123,10 +139,6 @@ def chunk_project(project_info: Dict[str, Any]) -> List[Dict[str, Any]]:
         List of all chunks from all files in the project
     """
     chunker = CodeChunker()
-    all_chunks = []
-
-    for file_info in project_info['files']:
-        chunks = chunker.chunk_file(file_info)
-        all_chunks.extend(chunks)
-
-    return all_chunks
\ No newline at end of file
+    return list(chain.from_iterable(
+        chunker.chunk_file(file_info) for file_info in project_info['files']
+    ))
\ No newline at end of file
@@ -1,26 +1,33 @@
 """Configuration for README generation."""
 
+from dataclasses import dataclass
 
+
+@dataclass(frozen=True, slots=True)
 class Config:
-    """Configuration for README generation using Ollama and ChromaDB."""
+    """
+    Configuration for README generation using Ollama and ChromaDB.
+
+    Instances are immutable and hashable, so adapters can share resources
+    between equal configurations.
 
-    def __init__(
-        self,
-        ollama_host: str,
-        llm_model: str = 'qwen2.5-coder:7b',
-        embed_model: str = 'nomic-embed-text',
-        db_path: str = './chroma_db'
-    ):
-        """
-        Initialize configuration.
+    Attributes:
+        ollama_host: Ollama server URL (required, e.g., 'http://polwarth:11434')
+        llm_model: LLM model for generation (default: qwen2.5-coder:7b)
+        embed_model: Embedding model (default: nomic-embed-text)
+        db_path: ChromaDB storage path (default: ./chroma_db)
+        embed_batch_size: Number of chunks embedded per request (default: 64)
+        add_batch_size: Number of chunks written to ChromaDB per call (default: 256)
+        max_concurrency: Maximum embedding requests in flight at once (default: 4)
+        rag_bypass_threshold: Projects with at most this many chunks are put in the
+            prompt whole, without embedding or retrieval (default: 5)
+    """
 
-        Args:
-            ollama_host: Ollama server URL (required, e.g., 'http://polwarth:11434')
-            llm_model: LLM model for generation (default: qwen2.5-coder:7b)
-            embed_model: Embedding model (default: nomic-embed-text)
-            db_path: ChromaDB storage path (default: ./chroma_db)
-        """
-        self.ollama_host = ollama_host
-        self.llm_model = llm_model
-        self.embed_model = embed_model
-        self.db_path = db_path
\ No newline at end of file
+    ollama_host: str
+    llm_model: str = 'qwen2.5-coder:7b'
+    embed_model: str = 'nomic-embed-text'
+    db_path: str = './chroma_db'
+    embed_batch_size: int = 64
+    add_batch_size: int = 256
+    max_concurrency: int = 4
+    rag_bypass_threshold: int = 5
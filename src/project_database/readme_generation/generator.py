@@ -1,15 +1,17 @@
 """Convenience functions for README generation."""
 
 import os
+from itertools import chain, islice
 from pathlib import Path
 from dotenv import load_dotenv
 
 from .config import Config
 from .ast_analyzer import CodeAnalyzer
-from .code_chunker import chunk_project
+from .code_chunker import CodeChunker
 from .rag_pipeline import ReadmeGenerator
 from .adapters.ollama_adapter import OllamaLLMAdapter, OllamaEmbeddingAdapter
 from .adapters.chromadb_adapter import ChromaDBAdapter
+from .adapters.cache_adapters import CachedLLMAdapter, EmbeddingCache
 
 
 def generate_readme_for_project(
@@ -18,18 +20,18 @@ def generate_readme_for_project(
     ollama_host: str = None,
     llm_model: str = 'qwen2.5-coder:7b',
     embed_model: str = 'nomic-embed-text',
-    db_path: str = './chroma_db'
+    db_path: str = './chroma_db',
+    use_cache: bool = True
 ) -> str:
     """
     Generate README for a project using the complete RAG pipeline.
 
     This is a convenience function that:
     1. Loads configuration from .env (if not provided)
-    2. Analyzes the project code
-    3. Chunks the code
-    4. Creates adapters
-    5. Generates README using RAG
-    6. Optionally saves to file
+    2. Creates adapters
+    3. Analyzes, chunks and indexes the project code, overlapping the stages
+    4. Generates README using RAG
+    5. Saves it to file
 
     Args:
         project_path: Path to project directory
@@ -38,6 +40,7 @@ def generate_readme_for_project(
         llm_model: LLM model to use
         embed_model: Embedding model to use
         db_path: ChromaDB storage path
+        use_cache: Reuse a cached README if the same prompt was answered recently
 
     Returns:
         Generated README text
@@ -69,12 +72,45 @@ def generate_readme_for_project(
         db_path=db_path
     )
 
-    # 2. Analyze project
+    # 2. Create adapters
+    print(f"\nInitializing RAG pipeline...")
+    llm = OllamaLLMAdapter(config)
+    if use_cache:
+        llm = CachedLLMAdapter(
+            llm,
+            cache_path=str(Path(config.db_path) / 'llm_cache'),
+            model=config.llm_model
+        )
+    embedder = EmbeddingCache(
+        OllamaEmbeddingAdapter(config),
+        cache_path=str(Path(config.db_path) / 'embed_cache'),
+        model=config.embed_model
+    )
+    vector_store = ChromaDBAdapter(config)
+    generator = ReadmeGenerator(llm, embedder, vector_store, config)
+
+    # 3. Analyze, chunk and index the project as one pipeline: files are
+    # chunked as soon as they are parsed, and chunks are embedded while
+    # later files are still being parsed
     print(f"\n{'='*60}")
-    print(f"Analyzing {project_path}")
+    print(f"Analyzing and indexing {project_path}")
     print('='*60)
 
-    analyzer = CodeAnalyzer()
+    analyzer = CodeAnalyzer(cache_dir=str(Path(config.db_path) / 'ast_cache'))
+    chunker = CodeChunker()
+    chunks = (
+        chunk
+        for file_info in analyzer.iter_project(project_path)
+        for chunk in chunker.chunk_file(file_info)
+    )
+    # Small projects go into the prompt whole, so read just enough chunks to tell
+    head = list(islice(chunks, config.rag_bypass_threshold + 1))
+    if len(head) > config.rag_bypass_threshold:
+        collection, chunk_count = generator.index_chunks(Path(project_path).name, chain(head, chunks))
+    else:
+        collection, chunk_count = None, len(head)
+
+    # Every file is cached by now, so this only collects the totals
     project_info = analyzer.analyze_project(project_path)
 
     if project_info['file_count'] == 0:
@@ -84,24 +120,19 @@ def generate_readme_for_project(
     print(f"✓ Found {project_info['file_count']} Python files")
     print(f"  - {project_info['total_functions']} functions")
     print(f"  - {project_info['total_classes']} classes")
+    if collection is None:
+        print(f"✓ {chunk_count} chunks, used without retrieval")
+    else:
+        print(f"✓ Indexed {chunk_count} chunks")
 
-    # 3. Chunk code
-    print(f"\nChunking code...")
-    chunks = chunk_project(project_info)
-    print(f"✓ Created {len(chunks)} chunks")
-
-    # 4. Create adapters
-    print(f"\nInitializing RAG pipeline...")
-    llm = OllamaLLMAdapter(config)
-    embedder = OllamaEmbeddingAdapter(config)
-    vector_store = ChromaDBAdapter(config)
-
-    # 5. Generate README
+    # 4-5. Generate README
     print(f"Generating README...")
-    generator = ReadmeGenerator(llm, embedder, vector_store, config)
-    readme = generator.generate_readme(project_info, chunks)
+    if collection is None:
+        readme = generator.generate_readme(project_info, head)
+    else:
+        readme = generator.generate_from_index(project_info, collection, chunk_count)
 
-    # 6. Save README
+    # 5. Save README
     if output_path is None:
         output_path = Path(project_path) / "README_GENERATED.md"
 
@@ -5,7 +5,7 @@ Adapters implement these ports for production or testing.
 """
 
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any
+from typing import Any, Dict, Iterator, List
 
 
 class LLMPort(ABC):
@@ -31,6 +31,28 @@ class LLMPort(ABC):
         """
         pass
 
+    def stream_generate(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        **options
+    ) -> Iterator[str]:
+        """
+        Generate text using the LLM, yielding pieces as they are produced.
+
+        Adapters backed by a streaming service should override this; the
+        default yields the whole response from generate at once.
+
+        Args:
+            system_prompt: System/role instruction for the LLM
+            user_prompt: User's prompt/question
+            **options: Model-specific options (temperature, max_tokens, etc.)
+
+        Yields:
+            Successive pieces of the generated text
+        """
+        yield self.generate(system_prompt, user_prompt, **options)
+
 
 class EmbeddingPort(ABC):
     """Port for generating text embeddings."""
@@ -48,6 +70,21 @@ class EmbeddingPort(ABC):
         """
         pass
 
+    def embed_batch(self, texts: List[str]) -> List[List[float]]:
+        """
+        Generate embedding vectors for several texts at once.
+
+        Adapters backed by a service that accepts multiple inputs per request
+        should override this; the default embeds each text in turn.
+
+        Args:
+            texts: Texts to embed
+
+        Returns:
+            Embedding vectors, in the same order as texts
+        """
+        return [self.embed(text) for text in texts]
+
 
 class VectorStorePort(ABC):
     """Port for vector database storage and retrieval."""
@@ -77,6 +114,8 @@ class VectorStorePort(ABC):
         """
         Add document chunks with embeddings to collection.
 
+        Chunks whose ID is already in the collection are left as they are.
+
         Args:
             collection: Collection object from create_collection()
             documents: List of document text chunks
@@ -86,6 +125,30 @@ class VectorStorePort(ABC):
         """
         pass
 
+    @abstractmethod
+    def get_ids(self, collection: Any) -> List[str]:
+        """
+        List the IDs of all chunks stored in collection.
+
+        Args:
+            collection: Collection object
+
+        Returns:
+            Chunk IDs
+        """
+        pass
+
+    @abstractmethod
+    def delete_chunks(self, collection: Any, ids: List[str]) -> None:
+        """
+        Remove chunks from collection.
+
+        Args:
+            collection: Collection object
+            ids: IDs of chunks to remove
+        """
+        pass
+
     @abstractmethod
     def query(
         self,
@@ -1,6 +1,10 @@
 """RAG pipeline for README generation using hexagonal architecture."""
 
-from typing import Dict, List, Any
+import hashlib
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from itertools import chain
+from typing import Dict, Iterable, Iterator, List, Any, Set, Tuple
 from .ports import LLMPort, EmbeddingPort, VectorStorePort
 from .config import Config
 
@@ -8,6 +12,9 @@ from .config import Config
 class ReadmeGenerator:
     """RAG pipeline for README generation using dependency injection."""
 
+    # Retrieval query used to find the most representative chunks
+    DEFAULT_QUERY = "main functionality entry point purpose usage"
+
     def __init__(
         self,
         llm: LLMPort,
@@ -28,6 +35,7 @@ class ReadmeGenerator:
         self.embedder = embedder
         self.vector_store = vector_store
         self.config = config
+        self._query_embeddings: Dict[str, List[float]] = {}
 
     def generate_readme(
         self,
@@ -48,22 +56,84 @@ class ReadmeGenerator:
         if len(chunks) == 0:
             return self._generate_empty_project_readme(project_info)
 
-        # 1. Create collection for this project
-        collection = self._create_collection(project_info['project_name'])
+        if len(chunks) <= self.config.rag_bypass_threshold:
+            # Small project: every chunk fits in the prompt, nothing to retrieve
+            readme = self._generate(project_info, [chunk['content'] for chunk in chunks])
+        else:
+            # 1-2. Create collection for this project and index chunks with embeddings
+            collection, chunk_count = self.index_chunks(project_info['project_name'], chunks)
 
-        # 2. Index chunks with embeddings
-        self._index_chunks(collection, chunks)
+            # 3-6. Retrieve context and generate with LLM
+            readme = self.generate_from_index(project_info, collection, chunk_count)
 
-        # 3. Build project summary
-        project_summary = self._build_project_summary(project_info)
+        return readme
+
+    def index_chunks(
+        self,
+        project_name: str,
+        chunks: Iterable[Dict[str, Any]]
+    ) -> Tuple[Any, int]:
+        """
+        Create the project's collection and index chunks into it.
+
+        Chunks may be a lazy iterable; they are embedded and stored in
+        batches as they arrive, so producing chunks, embedding and storing
+        overlap.
+
+        The collection is only created once the first chunk arrives, so a
+        project without code leaves nothing behind in the vector store.
+
+        Args:
+            project_name: Name of the project, used for the collection name
+            chunks: Code chunks from CodeChunker
+
+        Returns:
+            Tuple of (collection, number of distinct chunks indexed); the
+            collection is None if there were no chunks
+        """
+        chunks = iter(chunks)
+        first = next(chunks, None)
+        if first is None:
+            return None, 0
+
+        collection = self._create_collection(project_name)
+        chunk_count = self._index_chunks(collection, chain([first], chunks))
+        return collection, chunk_count
+
+    def generate_from_index(
+        self,
+        project_info: Dict[str, Any],
+        collection: Any,
+        chunk_count: int
+    ) -> str:
+        """
+        Generate README from a collection filled by index_chunks.
+
+        Args:
+            project_info: Project metadata from CodeAnalyzer
+            collection: Collection returned by index_chunks
+            chunk_count: Number of chunks returned by index_chunks
+
+        Returns:
+            Generated README text
+        """
+        if chunk_count == 0:
+            return self._generate_empty_project_readme(project_info)
 
-        # 4. Retrieve relevant context
+        # 3. Retrieve relevant context
         context_chunks = self._retrieve_context(
             collection,
-            query="main functionality entry point purpose usage",
-            n_results=min(5, len(chunks))
+            query=self.DEFAULT_QUERY,
+            n_results=min(5, chunk_count)
         )
 
+        return self._generate(project_info, context_chunks)
+
+    def _generate(self, project_info: Dict[str, Any], context_chunks: List[str]) -> str:
+        """Generate README with the LLM from project summary and context chunks."""
+        # 4. Build project summary
+        project_summary = self._build_project_summary(project_info)
+
         # 5. Build prompt
         prompt = self._build_readme_prompt(project_summary, context_chunks)
 
@@ -78,23 +148,84 @@ class ReadmeGenerator:
         return readme
 
     def _create_collection(self, project_name: str):
-        """Create or get collection for project."""
+        """
+        Create or get collection for project and embedding model.
+
+        Collections persist between runs, so the name includes a hash of the
+        embedding model; vectors from different models are never mixed.
+        """
         # Sanitize project name for collection
-        collection_name = project_name.lower().replace('-', '_').replace('.', '_')[:63]
-        return self.vector_store.create_collection(collection_name)
+        project_part = project_name.lower().replace('-', '_').replace('.', '_')[:54]
+        model_part = hashlib.blake2b(self.config.embed_model.encode('utf-8'), digest_size=4).hexdigest()
+        return self.vector_store.create_collection(f"{project_part}_{model_part}")
 
     def _index_chunks(
         self,
         collection: Any,
-        chunks: List[Dict[str, Any]]
-    ) -> None:
-        """Index chunks with embeddings into vector store."""
+        chunks: Iterable[Dict[str, Any]]
+    ) -> int:
+        """
+        Index chunks with embeddings into vector store.
+
+        Batches are embedded in worker threads while the next batch is
+        being built, and each batch is stored as soon as its embeddings
+        arrive. At most max_concurrency batches are in flight at once.
+
+        Chunk IDs are derived from file path and content, so chunks already
+        stored from an earlier run keep their ID and are not embedded again,
+        and stored chunks that no longer exist in the project are removed.
+        Identical content from different files is embedded once per batch.
+
+        Returns:
+            Number of distinct chunks indexed
+        """
+        stored = set(self.vector_store.get_ids(collection))
+        current = set()
+        pending = deque()
+
+        with ThreadPoolExecutor(max_workers=self.config.max_concurrency) as executor:
+            for batch in self._batches(chunks, current, stored):
+                pending.append((batch, executor.submit(self._embed_unique, batch[0])))
+                # Keep one extra batch queued so workers stay busy while we store
+                if len(pending) > self.config.max_concurrency:
+                    self._add_batch(collection, *pending.popleft())
+            while pending:
+                self._add_batch(collection, *pending.popleft())
+
+        # Remove chunks from previous runs that are no longer in the project
+        stale = list(stored - current)
+        if stale:
+            self.vector_store.delete_chunks(collection, stale)
+
+        return len(current)
+
+    def _batches(
+        self,
+        chunks: Iterable[Dict[str, Any]],
+        seen: Set[str],
+        stored: Set[str]
+    ) -> Iterator[Tuple[List[str], List[Dict[str, Any]], List[str]]]:
+        """
+        Group chunks into (documents, metadatas, ids) batches.
+
+        Every chunk ID is added to seen. Chunks already in seen, or already
+        in the vector store (stored), are not batched.
+        """
+        batch_size = self.config.embed_batch_size
         documents = []
         metadatas = []
         ids = []
-        embeddings = []
 
-        for i, chunk in enumerate(chunks):
+        for chunk in chunks:
+            chunk_id = self._chunk_id(chunk)
+            if chunk_id in seen:
+                # Identical chunk in the same file
+                continue
+            seen.add(chunk_id)
+            if chunk_id in stored:
+                # Indexed by an earlier run
+                continue
+
             documents.append(chunk['content'])
 
             # Flatten metadata
@@ -104,21 +235,46 @@ class ReadmeGenerator:
                 'name': chunk.get('name', 'module')
             }
             metadatas.append(meta)
-            ids.append(f"chunk_{i}")
+            ids.append(chunk_id)
+
+            if len(documents) == batch_size:
+                yield documents, metadatas, ids
+                documents, metadatas, ids = [], [], []
 
-            # Generate embedding
-            embedding = self.embedder.embed(chunk['content'])
-            embeddings.append(embedding)
+        if documents:
+            yield documents, metadatas, ids
 
-        # Add to vector store
+    def _embed_unique(self, documents: List[str]) -> List[List[float]]:
+        """Embed documents, sending each distinct text to the embedder once."""
+        unique = list(dict.fromkeys(documents))
+        if len(unique) == len(documents):
+            return self.embedder.embed_batch(documents)
+
+        vectors = dict(zip(unique, self.embedder.embed_batch(unique)))
+        return [vectors[document] for document in documents]
+
+    def _add_batch(
+        self,
+        collection: Any,
+        batch: Tuple[List[str], List[Dict[str, Any]], List[str]],
+        embeddings: Future
+    ) -> None:
+        """Wait for a batch's embeddings and add it to the vector store."""
+        documents, metadatas, ids = batch
         self.vector_store.add_chunks(
             collection=collection,
             documents=documents,
-            embeddings=embeddings,
+            embeddings=embeddings.result(),
             metadatas=metadatas,
             ids=ids
         )
 
+    @staticmethod
+    def _chunk_id(chunk: Dict[str, Any]) -> str:
+        """Build a stable chunk ID from its file path and content."""
+        digest = hashlib.sha256(f"{chunk['filepath']}\0{chunk['content']}".encode('utf-8'))
+        return f"chunk_{digest.hexdigest()[:32]}"
+
     def _retrieve_context(
         self,
         collection: Any,
@@ -126,8 +282,11 @@ class ReadmeGenerator:
         n_results: int
     ) -> List[str]:
         """Retrieve relevant code chunks."""
-        # Generate query embedding
-        query_embedding = self.embedder.embed(query)
+        # Generate query embedding, once per query for this generator
+        query_embedding = self._query_embeddings.get(query)
+        if query_embedding is None:
+            query_embedding = self.embedder.embed(query)
+            self._query_embeddings[query] = query_embedding
 
         # Query vector store
         results = self.vector_store.query(
@@ -155,13 +314,16 @@ class ReadmeGenerator:
 
     def _build_readme_prompt(self, summary: str, context_chunks: List[str]) -> str:
         """Build prompt for README generation."""
+        components = "\n".join(
+            f"--- Component {i+1} ---\n{chunk}" for i, chunk in enumerate(context_chunks)
+        )
         prompt = f"""Based on the following Python project information, generate a README.md file.
 
 PROJECT SUMMARY:
 {summary}
 
 KEY CODE COMPONENTS:
-{chr(10).join([f"--- Component {i+1} ---" + chr(10) + chunk for i, chunk in enumerate(context_chunks)])}
+{components}
 
 Generate a README with these sections:
 1. Project title and brief description (1-2 sentences)
@@ -1,11 +1,37 @@
 """Project scanning and metadata extraction functions."""
+import os
 import re
 import subprocess
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 from urllib.parse import unquote
 from typing import Optional
+from sqlalchemy import or_
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+
+from project_database.database import get_session
+from project_database.models import Project
+
+# Directories excluded when looking for the most recent file modification
+EXCLUDED_DIRS = frozenset({'venv', '.git', '__pycache__', 'node_modules', '.idea', '.pytest_cache', '.venv'})
+
+# Logseq link in Link.md. Format: [logseq](logseq://graph/NAME?page=PAGE_NAME)
+_LOGSEQ_RE = re.compile(r'\[logseq\]\(logseq://graph/[^?]+\?page=([^)]+)\)')
+
+# Bytes of Link.md searched for the link; a valid link is well under 200 bytes
+_LINK_READ_LIMIT = 4096
+
+# GitHub remote URLs, HTTPS and SSH forms
+_GH_HTTPS_RE = re.compile(r'https://github\.com/([^/]+)/([^/]+?)(\.git)?$')
+_GH_SSH_RE = re.compile(r'git@github\.com:([^/]+)/([^/]+?)(\.git)?$')
+
+# Body of the [remote "origin"] section in .git/config, up to the next section
+_ORIGIN_SECTION_RE = re.compile(r'^\s*\[remote "origin"\][^\n]*\n(.*?)(?=^\s*\[|\Z)', re.MULTILINE | re.DOTALL)
+# url key at the start of a line, so pushurl entries are not mistaken for it
+_URL_KEY_RE = re.compile(r'^\s*url\s*=\s*(\S+)', re.MULTILINE)
 
 
 def parse_logseq_link(link_file: Path) -> str | None:
@@ -24,31 +50,39 @@ def parse_logseq_link(link_file: Path) -> str | None:
 
         Returns: "project/my-project"
     """
-    # Check if file exists
-    if not link_file.exists():
+    try:
+        # Read a bounded prefix; a missing file raises FileNotFoundError, so no separate exists() check
+        with link_file.open('rb') as f:
+            content = f.read(_LINK_READ_LIMIT).decode('utf-8', errors='ignore')
+
+        return parse_logseq_link_from_text(content)
+
+    except Exception:
+        # If any error occurs (missing or unreadable file, etc.), return None
         return None
 
-    try:
-        # Read file content
-        content = link_file.read_text().strip()
 
-        # Pattern to match logseq URL and extract page parameter
-        # Format: [logseq](logseq://graph/NAME?page=PAGE_NAME)
-        pattern = r'\[logseq\]\(logseq://graph/[^?]+\?page=([^)]+)\)'
-        match = re.search(pattern, content)
+def parse_logseq_link_from_text(text: str) -> str | None:
+    """Parse logseq page reference from the contents of a Link.md file.
 
-        if not match:
-            return None
+    Args:
+        text: Link.md contents
 
-        # Extract and URL-decode the page name
-        page_name = match.group(1)
-        return unquote(page_name)
+    Returns:
+        The logseq page name (URL-decoded), or None if text doesn't contain
+        a valid logseq link.
+    """
+    # Match logseq URL and extract page parameter
+    match = _LOGSEQ_RE.search(text)
 
-    except Exception:
-        # If any error occurs (can't read file, etc.), return None
+    if not match:
         return None
 
+    # Extract and URL-decode the page name
+    return unquote(match.group(1))
+
 
+@lru_cache(maxsize=1024)
 def get_github_url(remote_url: Optional[str]) -> Optional[str]:
     """Extract GitHub URL from a git remote URL.
 
@@ -56,7 +90,8 @@ def get_github_url(remote_url: Optional[str]) -> Optional[str]:
         remote_url: Git remote URL (HTTPS or SSH format)
 
     Returns:
-        GitHub HTTPS URL without .git extension, or None if not a GitHub URL
+        GitHub HTTPS URL without .git extension, or None if not a GitHub URL.
+        Results are memoized, since re-scans see the same remotes.
 
     Examples:
         >>> get_github_url("https://github.com/user/repo.git")
@@ -76,15 +111,13 @@ def get_github_url(remote_url: Optional[str]) -> Optional[str]:
         return None
 
     # Handle HTTPS format: https://github.com/user/repo.git
-    https_pattern = r'https://github\.com/([^/]+)/([^/]+?)(\.git)?$'
-    match = re.match(https_pattern, remote_url)
+    match = _GH_HTTPS_RE.match(remote_url)
     if match:
         user, repo = match.group(1), match.group(2)
         return f"https://github.com/{user}/{repo}"
 
     # Handle SSH format: git@github.com:user/repo.git
-    ssh_pattern = r'git@github\.com:([^/]+)/([^/]+?)(\.git)?$'
-    match = re.match(ssh_pattern, remote_url)
+    match = _GH_SSH_RE.match(remote_url)
     if match:
         user, repo = match.group(1), match.group(2)
         return f"https://github.com/{user}/{repo}"
@@ -95,8 +128,8 @@ def get_github_url(remote_url: Optional[str]) -> Optional[str]:
 def get_last_file_modified_time(project_dir: Path) -> Optional[datetime]:
     """Find the most recent file modification time in a project directory.
 
-    Uses the 'find' command for fast scanning, excluding certain directories
-    (venv, .git, __pycache__, node_modules, .idea, .pytest_cache).
+    Walks the directory tree in-process with os.scandir, excluding certain
+    directories (venv, .git, __pycache__, node_modules, .idea, .pytest_cache).
 
     Args:
         project_dir: Path to project directory
@@ -109,54 +142,84 @@ def get_last_file_modified_time(project_dir: Path) -> Optional[datetime]:
         >>> print(last_mod)
         2025-11-18 15:30:45.123456
     """
-    # Directories to exclude from scanning
-    excluded_dirs = ['venv', '.git', '__pycache__', 'node_modules', '.idea', '.pytest_cache', '.venv']
+    max_timestamp = _walk_mtimes(str(project_dir), EXCLUDED_DIRS)
+    if not max_timestamp:
+        return None
 
-    try:
-        # Build find command with exclusions
-        # find /path -type f \( -path '*/venv/*' -o -path '*/.git/*' ... \) -prune -o -type f -printf '%T@\n'
-        find_cmd = ['find', str(project_dir), '-type', 'd']
+    return datetime.fromtimestamp(max_timestamp)
 
-        # Add exclusions: -path '*/dirname/*' -prune for each excluded directory
-        prune_args = []
-        for i, excluded in enumerate(excluded_dirs):
-            if i > 0:
-                prune_args.append('-o')
-            prune_args.extend(['-path', f'*/{excluded}/*'])
 
-        find_cmd.extend(['('] + prune_args + [')', '-prune', '-o', '-type', 'f', '-printf', '%T@\\n'])
+def _walk_mtimes(root: str, excluded: frozenset) -> float:
+    """Return the latest file mtime under root, not descending into excluded directories.
 
-        # Run find command
-        result = subprocess.run(
-            find_cmd,
-            cwd=project_dir,
-            capture_output=True,
-            text=True,
-            timeout=30  # 30 second timeout
-        )
-
-        if result.returncode != 0 or not result.stdout.strip():
-            return None
-
-        # Parse timestamps and find the maximum
-        timestamps = []
-        for line in result.stdout.strip().split('\n'):
-            if line:
+    Returns 0.0 if no files are found. Unreadable directories and files are skipped.
+    """
+    stack = [root]
+    best = 0.0
+    while stack:
+        directory = stack.pop()
+        try:
+            entries = os.scandir(directory)
+        except OSError:
+            continue
+        with entries:
+            for entry in entries:
                 try:
-                    timestamps.append(float(line))
-                except ValueError:
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name not in excluded:
+                            stack.append(entry.path)
+                    else:
+                        mtime = entry.stat(follow_symlinks=False).st_mtime
+                        if mtime > best:
+                            best = mtime
+                except OSError:
                     continue
+    return best
+
+
+def _read_origin_url(project_dir: Path) -> Optional[str]:
+    """Read the origin remote URL of a git repository.
+
+    Parses .git/config directly rather than running git. Falls back to
+    `git remote get-url origin` when .git exists but its config cannot be
+    read (e.g. worktrees and submodules, where .git is a file).
+
+    Args:
+        project_dir: Path to project directory
 
-        if not timestamps:
+    Returns:
+        The origin URL, or None if the project has no git repository or no origin remote
+    """
+    git_dir = project_dir / ".git"
+    try:
+        config = (git_dir / "config").read_text()
+    except OSError:
+        if not git_dir.exists():
             return None
+        return _git_origin_url(project_dir)
+
+    section = _ORIGIN_SECTION_RE.search(config)
+    if not section:
+        return None
+    match = _URL_KEY_RE.search(section.group(1))
+    return match.group(1) if match else None
 
-        # Convert the maximum timestamp to datetime
-        max_timestamp = max(timestamps)
-        return datetime.fromtimestamp(max_timestamp)
 
-    except (subprocess.TimeoutExpired, subprocess.SubprocessError, Exception):
-        # If find command fails, return None
+def _git_origin_url(project_dir: Path) -> Optional[str]:
+    """Ask git for the origin remote URL, or None if git fails or times out."""
+    try:
+        result = subprocess.run(
+            ["git", "remote", "get-url", "origin"],
+            cwd=project_dir,
+            capture_output=True,
+            text=True,
+            timeout=5
+        )
+    except Exception:
+        return None
+    if result.returncode != 0:
         return None
+    return result.stdout.strip()
 
 
 def collect_project_metadata(project_dir: Path) -> dict:
@@ -170,28 +233,14 @@ def collect_project_metadata(project_dir: Path) -> dict:
     """
     # Check for README.md
     readme = project_dir / "README.md"
-    readme_path = str(readme) if readme.exists() else None
+    readme_path = str(readme) if os.path.isfile(readme) else None
 
     # Parse Link.md for logseq page
     link_file = project_dir / "Link.md"
     logseq_page = parse_logseq_link(link_file)
 
     # Get git remote URL and extract GitHub URL
-    github_url = None
-    try:
-        result = subprocess.run(
-            ["git", "remote", "get-url", "origin"],
-            cwd=project_dir,
-            capture_output=True,
-            text=True,
-            timeout=5
-        )
-        if result.returncode == 0:
-            remote_url = result.stdout.strip()
-            github_url = get_github_url(remote_url)
-    except Exception:
-        # If git command fails or times out, github_url remains None
-        pass
+    github_url = get_github_url(_read_origin_url(project_dir))
 
     # Get most recent file modification time
     last_file_modified = get_last_file_modified_time(project_dir)
@@ -218,9 +267,11 @@ def scan_projects_directory(parent_dir: Path) -> list[Path]:
         List of Path objects for each direct subdirectory (excluding .claude)
     """
     projects = []
-    for item in parent_dir.iterdir():
-        if item.is_dir() and item.name != ".claude":
-            projects.append(item)
+    # DirEntry caches the file type from the directory listing, so is_dir needs no stat
+    with os.scandir(parent_dir) as entries:
+        for entry in entries:
+            if entry.name != ".claude" and entry.is_dir():
+                projects.append(parent_dir / entry.name)
     return projects
 
 
@@ -228,66 +279,77 @@ def populate_database(parent_dir: Path, max_workers: int = 16) -> None:
     """Scan a directory and populate database with all projects.
 
     For each direct subdirectory, collects metadata (in parallel) and adds/updates
-    the project in the database.
+    the project in the database, matching existing projects by path.
 
     Args:
         parent_dir: Parent directory containing projects (e.g., ~/git/active)
         max_workers: Maximum number of parallel workers for metadata collection (default: 16)
     """
-    from project_database.database import get_session
-    from project_database.models import Project
-
     # Scan for projects
     project_dirs = scan_projects_directory(parent_dir)
 
-    # Collect metadata in parallel using ThreadPoolExecutor
+    # Collect metadata in parallel using ThreadPoolExecutor; each task is I/O-bound
+    # (git subprocess, file stats), and subprocess timeouts bound a stuck task
     metadata_list = []
     with ThreadPoolExecutor(max_workers=max_workers) as executor:
         # Submit all metadata collection tasks
-        future_to_dir = {
-            executor.submit(collect_project_metadata, project_dir): project_dir
+        futures = [
+            (project_dir, executor.submit(collect_project_metadata, project_dir))
             for project_dir in project_dirs
-        }
+        ]
 
-        # Collect results as they complete
-        for future in as_completed(future_to_dir):
+        # Collect results in scan order, so rows are written in a repeatable order
+        for project_dir, future in futures:
             try:
-                metadata = future.result()
-                metadata_list.append(metadata)
+                metadata_list.append(future.result())
             except Exception as e:
                 # Log error but continue processing other projects
-                project_dir = future_to_dir[future]
                 print(f"Error processing {project_dir}: {e}")
 
     # Get database session
     session = get_session()
 
     try:
-        # Update database serially (for transaction safety)
-        for metadata in metadata_list:
-            # Check if project already exists (by path)
-            existing = session.query(Project).filter_by(path=metadata["path"]).first()
-
-            if existing:
-                # Update existing project
-                existing.name = metadata["name"]
-                existing.readme_path = metadata["readme_path"]
-                existing.logseq_page = metadata["logseq_page"]
-                existing.github_url = metadata["github_url"]
-                existing.last_file_modified = metadata["last_file_modified"]
-            else:
-                # Add new project
-                project = Project(
-                    name=metadata["name"],
-                    path=metadata["path"],
-                    readme_path=metadata["readme_path"],
-                    logseq_page=metadata["logseq_page"],
-                    github_url=metadata["github_url"],
-                    last_file_modified=metadata["last_file_modified"]
-                )
-                session.add(project)
+        # Insert new projects and update changed ones in a single statement
+        _upsert_projects(session, metadata_list)
 
         # Commit all changes
         session.commit()
     finally:
         session.close()
+
+
+# Project columns refreshed from collected metadata on every scan
+_UPSERT_COLUMNS = ("name", "readme_path", "logseq_page", "github_url", "last_file_modified")
+
+
+def _upsert_projects(session, metadata_list: list[dict]) -> None:
+    """Insert or update projects by path in one bulk INSERT ... ON CONFLICT statement.
+
+    Existing rows are only updated (and their updated_at bumped) when a
+    collected value differs from the stored one. Columns not collected by
+    the scanner, such as is_private, are left alone.
+
+    Args:
+        session: Database session to execute the statement in
+        metadata_list: Dictionaries from collect_project_metadata
+    """
+    if not metadata_list:
+        return
+
+    if session.get_bind().dialect.name == "postgresql":
+        insert = postgresql_insert
+    else:
+        insert = sqlite_insert
+
+    table = Project.__table__
+    stmt = insert(table)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[table.c.path],
+        set_={
+            **{column: stmt.excluded[column] for column in _UPSERT_COLUMNS},
+            "updated_at": datetime.now()
+        },
+        where=or_(*(table.c[column].is_distinct_from(stmt.excluded[column]) for column in _UPSERT_COLUMNS))
+    )
+    session.execute(stmt, metadata_list)
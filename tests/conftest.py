@@ -0,0 +1,120 @@
+"""Shared fixtures for project database tests."""
+import pytest
+from sqlalchemy import create_engine, event, insert
+from sqlalchemy.orm import Session, configure_mappers, sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from project_database import database
+from project_database.models import Base, Project
+
+# Configure mappers once at collection, so the first test to use a model doesn't pay for it
+configure_mappers()
+
+
+@pytest.fixture(scope="session")
+def db_engine():
+    """In-memory SQLite engine with all tables, created once per test session.
+
+    An in-memory database belongs to its process, so under pytest-xdist
+    each worker gets its own engine and database.
+
+    Yields:
+        The engine; tests use it through db_session or in_memory_db, which
+        both leave its tables empty.
+    """
+    engine = create_engine(
+        "sqlite:///:memory:",
+        poolclass=StaticPool,
+        connect_args={"check_same_thread": False}
+    )
+
+    # pysqlite's own transaction handling breaks SAVEPOINTs; let SQLAlchemy emit BEGIN
+    @event.listens_for(engine, "connect")
+    def _disable_pysqlite_transactions(dbapi_connection, connection_record):
+        dbapi_connection.isolation_level = None
+
+    @event.listens_for(engine, "begin")
+    def _begin(connection):
+        connection.exec_driver_sql("BEGIN")
+
+    Base.metadata.create_all(engine)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def db_session(db_engine):
+    """Session whose work is rolled back when the test ends.
+
+    The session joins an outer transaction on the shared connection, and
+    its commits only release SAVEPOINTs, so each test starts from empty
+    tables without the schema being created again.
+
+    Yields:
+        A SQLAlchemy session bound to the shared in-memory database.
+    """
+    connection = db_engine.connect()
+    transaction = connection.begin()
+    session = Session(bind=connection, join_transaction_mode="create_savepoint")
+    yield session
+    session.close()
+    transaction.rollback()
+    connection.close()
+
+
+class ProjectFactory:
+    """Creates Project rows in bulk, with one executemany INSERT per batch."""
+
+    def __init__(self, session):
+        self.session = session
+
+    @staticmethod
+    def rows(n, **overrides):
+        """Build n Project column dictionaries with unique names and paths.
+
+        Args:
+            n: Number of rows
+            **overrides: Column values applied to every row
+
+        Returns:
+            List of column dictionaries
+        """
+        return [
+            {"name": f"project-{i}", "path": f"/projects/project-{i}", **overrides}
+            for i in range(n)
+        ]
+
+    def create_batch(self, n, **overrides):
+        """Insert n projects and flush, skipping the ORM's per-object unit of work.
+
+        Returns:
+            The inserted column dictionaries
+        """
+        rows = self.rows(n, **overrides)
+        self.session.execute(insert(Project), rows)
+        self.session.flush()
+        return rows
+
+
+@pytest.fixture
+def project_factory(db_session):
+    """ProjectFactory bound to db_session."""
+    return ProjectFactory(db_session)
+
+
+@pytest.fixture
+def in_memory_db(monkeypatch, db_engine):
+    """Point get_session at the shared in-memory SQLite database, emptied.
+
+    Code under test commits through its own sessions, so rows are deleted
+    after each test rather than rolled back; the schema is kept.
+
+    Yields:
+        The engine bound to the in-memory database.
+    """
+    monkeypatch.setattr(database, "_engine", db_engine)
+    monkeypatch.setattr(database, "_SessionMaker", sessionmaker(bind=db_engine))
+    yield db_engine
+    with db_engine.begin() as connection:
+        for table in reversed(Base.metadata.sorted_tables):
+            connection.execute(table.delete())
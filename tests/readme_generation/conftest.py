@@ -0,0 +1,55 @@
+"""Shared fixtures for README generation tests."""
+
+from pathlib import Path
+import pytest
+from project_database.readme_generation.config import Config
+from project_database.readme_generation.ast_analyzer import CodeAnalyzer
+from project_database.readme_generation.code_chunker import CodeChunker, chunk_project
+from project_database.readme_generation.adapters.mock_adapters import (
+    MockLLMAdapter,
+    MockEmbeddingAdapter,
+    MockVectorStoreAdapter
+)
+
+
+# Test fixtures path
+FIXTURES_DIR = Path(__file__).parent / 'fixtures'
+SAMPLE_MODULE = FIXTURES_DIR / 'sample_module.py'
+
+
+# Config, analysis and chunking results are read-only in tests, so each module builds them once
+
+@pytest.fixture(scope="module")
+def config():
+    """Default configuration for tests that never reach Ollama."""
+    return Config(ollama_host='http://localhost:11434')
+
+
+@pytest.fixture(scope="module")
+def sample_file_info():
+    """Analysis of the sample module."""
+    return CodeAnalyzer().analyze_file(str(SAMPLE_MODULE))
+
+
+@pytest.fixture(scope="module")
+def sample_chunks(sample_file_info):
+    """Chunks of the sample module."""
+    return CodeChunker().chunk_file(sample_file_info)
+
+
+@pytest.fixture(scope="module")
+def project_info():
+    """Analysis of the fixtures directory as a project."""
+    return CodeAnalyzer().analyze_project(str(FIXTURES_DIR))
+
+
+@pytest.fixture(scope="module")
+def project_chunks(project_info):
+    """Chunks of the fixtures project."""
+    return chunk_project(project_info)
+
+
+@pytest.fixture
+def mocks():
+    """Fresh (llm, embedder, vector_store) mock adapters; they record calls, so are not shared."""
+    return MockLLMAdapter(), MockEmbeddingAdapter(), MockVectorStoreAdapter()
@@ -71,6 +71,27 @@ def test_analyze_file_extracts_imports():
     assert 'pathlib.Path' in imports
 
 
+def test_analyze_file_extracts_conditional_imports(tmp_path):
+    """Should extract imports under try/except, if TYPE_CHECKING and function bodies."""
+    source = tmp_path / 'optional.py'
+    source.write_text(
+        "import os\n"
+        "try:\n"
+        "    import numpy\n"
+        "except ImportError:\n"
+        "    numpy = None\n"
+        "from typing import TYPE_CHECKING\n"
+        "if TYPE_CHECKING:\n"
+        "    from collections import OrderedDict\n"
+        "def dump():\n"
+        "    import json\n"
+    )
+
+    imports = CodeAnalyzer().analyze_file(str(source))['imports']
+
+    assert set(imports) == {'os', 'numpy', 'typing.TYPE_CHECKING', 'collections.OrderedDict', 'json'}
+
+
 def test_analyze_file_extracts_module_docstring():
     """Should extract module-level docstring."""
     analyzer = CodeAnalyzer()
@@ -80,14 +101,12 @@ def test_analyze_file_extracts_module_docstring():
     assert 'Sample module for testing' in result['module_docstring']
 
 
-def test_analyze_file_includes_source():
-    """Should include the full source code."""
+def test_analyze_file_does_not_keep_source():
+    """Should not hold the source code in memory with the analysis."""
     analyzer = CodeAnalyzer()
     result = analyzer.analyze_file(str(SAMPLE_MODULE))
 
-    assert 'source' in result
-    assert 'def simple_function' in result['source']
-    assert 'class SampleClass' in result['source']
+    assert 'source' not in result
 
 
 def test_analyze_file_handles_syntax_error():
@@ -139,4 +158,216 @@ def test_analyze_project_aggregates_statistics():
 
     assert 'all_imports' in result
     assert 'os' in result['all_imports']
-    assert 'sys' in result['all_imports']
\ No newline at end of file
+    assert 'sys' in result['all_imports']
+
+
+def test_analyze_project_serial_matches_parallel():
+    """Should give the same analysis whether files are parsed in parallel or not."""
+    analyzer = CodeAnalyzer()
+
+    parallel = analyzer.analyze_project(str(FIXTURES_DIR), max_workers=2)
+    serial = analyzer.analyze_project(str(FIXTURES_DIR), max_workers=1)
+
+    assert parallel == serial
+
+
+def test_analyze_project_orders_files_by_path(tmp_path):
+    """Should list files sorted by path, with sorted imports."""
+    for name in ['b.py', 'a.py', 'c.py']:
+        (tmp_path / name).write_text(f"import {name[0]}mod\nimport os\n")
+    (tmp_path / 'pkg').mkdir()
+    (tmp_path / 'pkg' / 'mod.py').write_text("import sys\n")
+
+    result = CodeAnalyzer().analyze_project(str(tmp_path), max_workers=2)
+
+    paths = [f['filepath'] for f in result['files']]
+    assert paths == sorted(paths)
+    assert result['all_imports'] == sorted(result['all_imports'])
+
+
+def test_analyze_file_skips_nested_functions(tmp_path):
+    """Should report module-level functions and methods, not functions nested in them."""
+    source_file = tmp_path / 'nested.py'
+    source_file.write_text(
+        "def outer():\n"
+        "    def inner():\n"
+        "        pass\n"
+        "    return inner\n"
+        "\n"
+        "class Widget:\n"
+        "    def method(self):\n"
+        "        def helper():\n"
+        "            pass\n"
+    )
+
+    analyzer = CodeAnalyzer()
+    result = analyzer.analyze_file(str(source_file))
+
+    assert [f['name'] for f in result['functions']] == ['outer', 'method']
+
+
+def test_analyze_project_reuses_unchanged_files(tmp_path, monkeypatch):
+    """Should not re-parse files that are unchanged since the last analysis."""
+    module = tmp_path / 'module.py'
+    module.write_text("def first():\n    pass\n")
+
+    analyzer = CodeAnalyzer()
+    analyzer.analyze_project(str(tmp_path), max_workers=1)
+
+    parsed = []
+    original = CodeAnalyzer.analyze_file
+    monkeypatch.setattr(
+        CodeAnalyzer, 'analyze_file',
+        lambda self, filepath: parsed.append(filepath) or original(self, filepath)
+    )
+
+    result = analyzer.analyze_project(str(tmp_path), max_workers=1)
+    assert parsed == []
+    assert result['total_functions'] == 1
+
+    module.write_text("def first():\n    pass\n\n\ndef second():\n    pass\n")
+    result = analyzer.analyze_project(str(tmp_path), max_workers=1)
+    assert parsed == [str(module)]
+    assert result['total_functions'] == 2
+
+
+def test_analyze_project_skips_environment_directories(tmp_path):
+    """Should not analyze files inside virtualenv, git or cache directories."""
+    (tmp_path / 'main.py').write_text("def main():\n    pass\n")
+    for skipped in ['.venv', 'venv', '__pycache__', '.git', 'node_modules', '.tox']:
+        (tmp_path / skipped).mkdir()
+        (tmp_path / skipped / 'ignored.py').write_text("def ignored():\n    pass\n")
+
+    analyzer = CodeAnalyzer()
+    result = analyzer.analyze_project(str(tmp_path), max_workers=1)
+
+    assert result['file_count'] == 1
+    assert result['files'][0]['filepath'] == str(tmp_path / 'main.py')
+
+
+def test_analyze_file_extracts_qualified_base_names(tmp_path):
+    """Should report dotted base class names in full."""
+    source_file = tmp_path / 'models.py'
+    source_file.write_text("class Model(sqlalchemy.orm.decl_api.Base, Mixin):\n    pass\n")
+
+    analyzer = CodeAnalyzer()
+    result = analyzer.analyze_file(str(source_file))
+
+    assert result['classes'][0]['bases'] == ['sqlalchemy.orm.decl_api.Base', 'Mixin']
+
+
+def test_analyze_file_cleans_docstring_indentation(tmp_path):
+    """Should dedent multi-line docstrings and report missing ones as empty."""
+    source_file = tmp_path / 'docs.py'
+    source_file.write_text(
+        'def documented():\n'
+        '    """First line.\n'
+        '\n'
+        '        Indented detail.\n'
+        '    """\n'
+        '\n'
+        'def undocumented():\n'
+        '    return "not a docstring"\n'
+    )
+
+    analyzer = CodeAnalyzer()
+    result = analyzer.analyze_file(str(source_file))
+
+    documented, undocumented = result['functions']
+    assert documented['docstring'] == 'First line.\n\nIndented detail.'
+    assert undocumented['docstring'] == ''
+    assert result['module_docstring'] is None
+
+
+def test_analyze_file_honours_source_encoding(tmp_path):
+    """Should parse files declaring a non-UTF-8 source encoding."""
+    source_file = tmp_path / 'latin.py'
+    source_file.write_bytes(
+        b'# -*- coding: latin-1 -*-\n'
+        b'def caf\xe9():\n'
+        b'    """Caf\xe9 function."""\n'
+    )
+
+    analyzer = CodeAnalyzer()
+    result = analyzer.analyze_file(str(source_file))
+
+    assert result['functions'][0]['name'] == 'café'
+    assert result['functions'][0]['docstring'] == 'Café function.'
+
+
+def test_iter_project_matches_analyze_project():
+    """iter_project should yield the same files, in order, as analyze_project."""
+    analyzer = CodeAnalyzer()
+
+    streamed = list(analyzer.iter_project(str(FIXTURES_DIR), max_workers=2))
+    result = analyzer.analyze_project(str(FIXTURES_DIR), max_workers=2)
+
+    assert streamed == result['files']
+
+
+def test_analyze_file_reuses_disk_cache(tmp_path, monkeypatch):
+    """Analyzers sharing a cache_dir should not re-parse unchanged source."""
+    source = tmp_path / 'module.py'
+    source.write_text('def f():\n    pass\n')
+    cache_dir = tmp_path / 'cache'
+
+    first = CodeAnalyzer(cache_dir=str(cache_dir)).analyze_file(str(source))
+
+    def fail(*args):
+        raise AssertionError("source parsed again")
+
+    monkeypatch.setattr(CodeAnalyzer, '_analyze_source', fail)
+    second = CodeAnalyzer(cache_dir=str(cache_dir)).analyze_file(str(source))
+    assert second == first
+
+    monkeypatch.undo()
+    source.write_text('def g():\n    pass\n')
+    changed = CodeAnalyzer(cache_dir=str(cache_dir)).analyze_file(str(source))
+    assert [f['name'] for f in changed['functions']] == ['g']
+
+
+def test_analyze_project_with_disk_cache_matches_uncached(tmp_path):
+    """Project analysis through the disk cache should match a plain analysis."""
+    cache_dir = str(tmp_path / 'cache')
+
+    CodeAnalyzer(cache_dir=cache_dir).analyze_project(str(FIXTURES_DIR), max_workers=2)
+    cached = CodeAnalyzer(cache_dir=cache_dir).analyze_project(str(FIXTURES_DIR), max_workers=2)
+
+    assert cached == CodeAnalyzer().analyze_project(str(FIXTURES_DIR))
+
+
+def test_disk_cache_keeps_one_entry_per_file(tmp_path):
+    """Editing a file should replace its cache entry, not add another."""
+    source = tmp_path / 'module.py'
+    cache_dir = tmp_path / 'cache'
+
+    for body in ['def f():\n    pass\n', 'def g():\n    pass\n', 'def h():\n    pass\n']:
+        source.write_text(body)
+        result = CodeAnalyzer(cache_dir=str(cache_dir)).analyze_file(str(source))
+
+    assert [f['name'] for f in result['functions']] == ['h']
+    assert len(list(cache_dir.iterdir())) == 1
+
+
+def test_disk_cache_failures_do_not_stop_analysis(tmp_path, monkeypatch):
+    """Unwritable or corrupt cache entries should fall back to parsing the source."""
+    import os
+
+    source = tmp_path / 'module.py'
+    source.write_text('def f():\n    pass\n')
+    cache_dir = tmp_path / 'cache'
+
+    def disk_full(*args):
+        raise OSError(28, "No space left on device")
+
+    monkeypatch.setattr(os, 'replace', disk_full)
+    result = CodeAnalyzer(cache_dir=str(cache_dir)).analyze_file(str(source))
+    assert [f['name'] for f in result['functions']] == ['f']
+    assert list(cache_dir.iterdir()) == []
+
+    monkeypatch.undo()
+    CodeAnalyzer(cache_dir=str(cache_dir)).analyze_file(str(source))
+    entry, = cache_dir.iterdir()
+    entry.write_bytes(b'not a pickle')
+    result = CodeAnalyzer(cache_dir=str(cache_dir)).analyze_file(str(source))
+    assert [f['name'] for f in result['functions']] == ['f']
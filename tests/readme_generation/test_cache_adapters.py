@@ -0,0 +1,184 @@
+"""Tests for caching adapters."""
+
+import numpy as np
+import pytest
+from project_database.readme_generation.ports import LLMPort, EmbeddingPort
+from project_database.readme_generation.adapters.mock_adapters import (
+    MockLLMAdapter,
+    MockEmbeddingAdapter
+)
+from project_database.readme_generation.adapters.cache_adapters import (
+    CachedLLMAdapter,
+    EmbeddingCache
+)
+
+
+def test_embedding_cache_implements_port(tmp_path):
+    """EmbeddingCache should implement EmbeddingPort."""
+    cache = EmbeddingCache(MockEmbeddingAdapter(), str(tmp_path / 'embed_cache'), 'model')
+    assert isinstance(cache, EmbeddingPort)
+
+
+def test_embedding_cache_returns_wrapped_embeddings(tmp_path):
+    """EmbeddingCache should return the same vectors as the wrapped embedder."""
+    embedder = MockEmbeddingAdapter()
+    cache = EmbeddingCache(embedder, str(tmp_path / 'embed_cache'), 'model')
+
+    result = cache.embed_batch(["text 1", "text 2"])
+
+    expected = [embedder.embed("text 1"), embedder.embed("text 2")]
+    assert np.allclose(result, expected, atol=1e-3)
+
+
+def test_embedding_cache_only_embeds_misses(tmp_path):
+    """EmbeddingCache should send only uncached texts to the wrapped embedder."""
+    embedder = MockEmbeddingAdapter()
+    cache = EmbeddingCache(embedder, str(tmp_path / 'embed_cache'), 'model')
+
+    cache.embed_batch(["text 1", "text 2"])
+    embedder.embedded_texts.clear()
+
+    result = cache.embed_batch(["text 1", "text 3", "text 2"])
+
+    assert embedder.embedded_texts == ["text 3"]
+    assert len(result) == 3
+
+
+def test_embedding_cache_persists_across_instances(tmp_path):
+    """EmbeddingCache should reuse vectors stored by an earlier instance."""
+    cache_path = str(tmp_path / 'embed_cache')
+    EmbeddingCache(MockEmbeddingAdapter(), cache_path, 'model').embed("text 1")
+
+    embedder = MockEmbeddingAdapter()
+    EmbeddingCache(embedder, cache_path, 'model').embed("text 1")
+
+    assert embedder.embedded_texts == []
+
+
+def test_embedding_cache_keys_include_model(tmp_path):
+    """EmbeddingCache should not share vectors between models."""
+    cache_path = str(tmp_path / 'embed_cache')
+    EmbeddingCache(MockEmbeddingAdapter(), cache_path, 'model-a').embed("text 1")
+
+    embedder = MockEmbeddingAdapter()
+    EmbeddingCache(embedder, cache_path, 'model-b').embed("text 1")
+
+    assert embedder.embedded_texts == ["text 1"]
+
+
+def test_embedding_cache_returns_same_vector_on_hit_and_miss(tmp_path):
+    """EmbeddingCache should return identical vectors for a miss and a later hit."""
+    cache = EmbeddingCache(MockEmbeddingAdapter(), str(tmp_path / 'embed_cache'), 'model')
+
+    first = cache.embed("text 1")
+    second = cache.embed("text 1")
+
+    assert first == second
+
+
+def test_embedding_cache_int8_storage(tmp_path):
+    """EmbeddingCache should approximate vectors when stored as int8."""
+    embedder = MockEmbeddingAdapter()
+    cache = EmbeddingCache(embedder, str(tmp_path / 'embed_cache'), 'model', dtype='int8')
+
+    result = cache.embed("text 1")
+
+    assert len(result) == embedder.embedding_dim
+    assert np.allclose(result, embedder.embed("text 1"), atol=0.01)
+
+
+def test_embedding_cache_rejects_unknown_dtype(tmp_path):
+    """EmbeddingCache should only accept supported storage types."""
+    with pytest.raises(ValueError):
+        EmbeddingCache(MockEmbeddingAdapter(), str(tmp_path / 'embed_cache'), 'model', dtype='int4')
+
+
+def test_cached_llm_implements_port(tmp_path):
+    """CachedLLMAdapter should implement LLMPort."""
+    cache = CachedLLMAdapter(MockLLMAdapter(), str(tmp_path / 'llm_cache'), 'model')
+    assert isinstance(cache, LLMPort)
+
+
+def test_cached_llm_returns_cached_response(tmp_path):
+    """CachedLLMAdapter should call the wrapped LLM once for repeated prompts."""
+    llm = MockLLMAdapter(canned_response="# README")
+    cache = CachedLLMAdapter(llm, str(tmp_path / 'llm_cache'), 'model')
+
+    first = cache.generate("sys", "user", temperature=0.3)
+    second = cache.generate("sys", "user", temperature=0.3)
+
+    assert first == second == "# README"
+    assert llm.call_count == 1
+
+
+def test_cached_llm_keys_include_prompts_and_options(tmp_path):
+    """CachedLLMAdapter should treat different prompts or options as misses."""
+    llm = MockLLMAdapter()
+    cache = CachedLLMAdapter(llm, str(tmp_path / 'llm_cache'), 'model')
+
+    cache.generate("sys", "user", temperature=0.3)
+    cache.generate("sys", "other user", temperature=0.3)
+    cache.generate("other sys", "user", temperature=0.3)
+    cache.generate("sys", "user", temperature=0.7)
+
+    assert llm.call_count == 4
+
+
+def test_cached_llm_ignores_expired_entries(tmp_path):
+    """CachedLLMAdapter should regenerate responses older than the TTL."""
+    llm = MockLLMAdapter()
+    cache = CachedLLMAdapter(llm, str(tmp_path / 'llm_cache'), 'model', ttl_seconds=-1)
+
+    cache.generate("sys", "user")
+    cache.generate("sys", "user")
+
+    assert llm.call_count == 2
+
+
+def test_cached_llm_evicts_least_recently_used(tmp_path):
+    """CachedLLMAdapter should keep at most max_entries responses."""
+    llm = MockLLMAdapter()
+    cache = CachedLLMAdapter(llm, str(tmp_path / 'llm_cache'), 'model', max_entries=2)
+
+    cache.generate("sys", "user 1")
+    cache.generate("sys", "user 2")
+    cache.generate("sys", "user 1")
+    cache.generate("sys", "user 3")
+    assert llm.call_count == 3
+
+    cache.generate("sys", "user 1")
+    assert llm.call_count == 3
+
+    cache.generate("sys", "user 2")
+    assert llm.call_count == 4
+
+
+def test_cached_llm_similarity_hit(tmp_path):
+    """CachedLLMAdapter should reuse a response for a similar user prompt."""
+    llm = MockLLMAdapter()
+    embedder = MockEmbeddingAdapter()
+    embedder.embed = lambda text: [1.0, 0.0] if text.startswith("user") else [0.0, 1.0]
+    cache = CachedLLMAdapter(
+        llm, str(tmp_path / 'llm_cache'), 'model', embedder=embedder
+    )
+
+    cache.generate("sys", "user prompt")
+    cache.generate("sys", "user prompt, slightly changed")
+    assert llm.call_count == 1
+
+    cache.generate("sys", "unrelated prompt")
+    assert llm.call_count == 2
+
+
+def test_cached_llm_zero_embedding_never_matches(tmp_path):
+    """CachedLLMAdapter should treat all-zero prompt embeddings as dissimilar."""
+    llm = MockLLMAdapter()
+    embedder = MockEmbeddingAdapter()
+    embedder.embed = lambda text: [0.0, 0.0]
+    cache = CachedLLMAdapter(
+        llm, str(tmp_path / 'llm_cache'), 'model', embedder=embedder
+    )
+
+    cache.generate("sys", "first prompt")
+    cache.generate("sys", "second prompt")
+    assert llm.call_count == 2
@@ -1,25 +1,17 @@
 """Tests for code chunker."""
 
 from pathlib import Path
-from project_database.readme_generation.ast_analyzer import CodeAnalyzer
-from project_database.readme_generation.code_chunker import CodeChunker, chunk_project
+from project_database.readme_generation.code_chunker import chunk_project
 
 
 # Test fixtures path
-FIXTURES_DIR = Path(__file__).parent / 'fixtures'
-SAMPLE_MODULE = FIXTURES_DIR / 'sample_module.py'
+SAMPLE_MODULE = Path(__file__).parent / 'fixtures' / 'sample_module.py'
 
 
-def test_chunk_file_creates_module_chunk():
+def test_chunk_file_creates_module_chunk(sample_chunks):
     """Should create a module-level chunk with docstring and imports."""
-    analyzer = CodeAnalyzer()
-    file_info = analyzer.analyze_file(str(SAMPLE_MODULE))
-
-    chunker = CodeChunker()
-    chunks = chunker.chunk_file(file_info)
-
     # Should have at least one module chunk
-    module_chunks = [c for c in chunks if c['type'] == 'module']
+    module_chunks = [c for c in sample_chunks if c['type'] == 'module']
     assert len(module_chunks) == 1
 
     module_chunk = module_chunks[0]
@@ -27,16 +19,10 @@ def test_chunk_file_creates_module_chunk():
     assert module_chunk['filepath'] == str(SAMPLE_MODULE)
 
 
-def test_chunk_file_creates_function_chunks():
+def test_chunk_file_creates_function_chunks(sample_chunks):
     """Should create chunks for each function."""
-    analyzer = CodeAnalyzer()
-    file_info = analyzer.analyze_file(str(SAMPLE_MODULE))
-
-    chunker = CodeChunker()
-    chunks = chunker.chunk_file(file_info)
-
     # Should have function chunks (including methods)
-    function_chunks = [c for c in chunks if c['type'] == 'function']
+    function_chunks = [c for c in sample_chunks if c['type'] == 'function']
     assert len(function_chunks) == 5  # 2 functions + 3 methods
 
     # Check one function chunk in detail
@@ -50,16 +36,10 @@ def test_chunk_file_creates_function_chunks():
     assert func_chunk['metadata']['args'] == ['arg1', 'arg2']
 
 
-def test_chunk_file_creates_class_chunks():
+def test_chunk_file_creates_class_chunks(sample_chunks):
     """Should create chunks for each class."""
-    analyzer = CodeAnalyzer()
-    file_info = analyzer.analyze_file(str(SAMPLE_MODULE))
-
-    chunker = CodeChunker()
-    chunks = chunker.chunk_file(file_info)
-
     # Should have class chunks
-    class_chunks = [c for c in chunks if c['type'] == 'class']
+    class_chunks = [c for c in sample_chunks if c['type'] == 'class']
     assert len(class_chunks) == 2
 
     # Check one class chunk in detail
@@ -73,26 +53,37 @@ def test_chunk_file_creates_class_chunks():
     assert 'method_one' in class_chunk['metadata']['methods']
 
 
-def test_chunk_file_includes_metadata():
-    """Should include appropriate metadata in each chunk."""
-    analyzer = CodeAnalyzer()
-    file_info = analyzer.analyze_file(str(SAMPLE_MODULE))
+def test_chunk_file_extracts_exact_definition_source(sample_chunks):
+    """Should include the whole definition and nothing after it."""
+    simple_func = [c for c in sample_chunks if c.get('name') == 'simple_function'][0]
+    assert simple_func['content'].endswith('return arg1 + arg2')
 
-    chunker = CodeChunker()
-    chunks = chunker.chunk_file(file_info)
+    sample_class = [c for c in sample_chunks if c.get('name') == 'SampleClass'][0]
+    assert 'return param' in sample_class['content']
+    assert 'class ChildClass' not in sample_class['content']
 
-    for chunk in chunks:
+
+def test_chunk_file_orders_chunks_by_source_position(sample_chunks):
+    """Should emit function and class chunks in the order they appear in the file."""
+    names = [c['name'] for c in sample_chunks if c['type'] != 'module']
+    assert names == [
+        'simple_function', 'another_function',
+        'SampleClass', 'method_one', 'method_two',
+        'ChildClass', 'child_method'
+    ]
+
+
+def test_chunk_file_includes_metadata(sample_chunks):
+    """Should include appropriate metadata in each chunk."""
+    for chunk in sample_chunks:
         assert 'type' in chunk
         assert 'filepath' in chunk
         assert 'content' in chunk
         assert 'metadata' in chunk
 
 
-def test_chunk_project_processes_all_files():
+def test_chunk_project_processes_all_files(project_info):
     """Should chunk all files in a project."""
-    analyzer = CodeAnalyzer()
-    project_info = analyzer.analyze_project(str(FIXTURES_DIR))
-
     all_chunks = chunk_project(project_info)
 
     # Should have chunks from the sample module
@@ -105,11 +96,8 @@ def test_chunk_project_processes_all_files():
     assert 'class' in chunk_types
 
 
-def test_chunk_project_returns_list():
+def test_chunk_project_returns_list(project_info):
     """Should return a list of chunk dictionaries."""
-    analyzer = CodeAnalyzer()
-    project_info = analyzer.analyze_project(str(FIXTURES_DIR))
-
     all_chunks = chunk_project(project_info)
 
     assert isinstance(all_chunks, list)
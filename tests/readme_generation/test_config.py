@@ -1,5 +1,7 @@
 """Tests for configuration."""
 
+import dataclasses
+import pytest
 from project_database.readme_generation.config import Config
 
 
@@ -27,6 +29,24 @@ def test_config_has_default_db_path():
     assert config.db_path == './chroma_db'
 
 
+def test_config_has_default_embed_batch_size():
+    """Config should have a default embedding batch size."""
+    config = Config(ollama_host='http://localhost:11434')
+    assert config.embed_batch_size == 64
+
+
+def test_config_has_default_add_batch_size():
+    """Config should have a default vector store batch size."""
+    config = Config(ollama_host='http://localhost:11434')
+    assert config.add_batch_size == 256
+
+
+def test_config_has_default_max_concurrency():
+    """Config should have a default limit on concurrent embedding requests."""
+    config = Config(ollama_host='http://localhost:11434')
+    assert config.max_concurrency == 4
+
+
 def test_config_can_be_customized():
     """Config should accept custom values."""
     custom_config = Config(
@@ -39,4 +59,24 @@ def test_config_can_be_customized():
     assert custom_config.ollama_host == 'http://custom:11434'
     assert custom_config.llm_model == 'custom-model:7b'
     assert custom_config.embed_model == 'custom-embed'
-    assert custom_config.db_path == '/custom/path'
\ No newline at end of file
+    assert custom_config.db_path == '/custom/path'
+
+
+def test_config_has_default_rag_bypass_threshold():
+    """Config should have a default chunk count below which retrieval is skipped."""
+    config = Config(ollama_host='http://localhost:11434')
+    assert config.rag_bypass_threshold == 5
+
+
+def test_config_is_immutable():
+    """Config should reject attribute changes after creation."""
+    config = Config(ollama_host='http://localhost:11434')
+
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        config.llm_model = 'other-model'
+
+
+def test_equal_configs_hash_equal():
+    """Equal Configs should be interchangeable as dictionary keys."""
+    assert Config(ollama_host='http://a:11434') == Config(ollama_host='http://a:11434')
+    assert len({Config(ollama_host='http://a:11434'), Config(ollama_host='http://a:11434')}) == 1
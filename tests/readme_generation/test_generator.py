@@ -0,0 +1,72 @@
+"""Tests for generate_readme_for_project using mock adapters."""
+
+import pytest
+from pathlib import Path
+from project_database.readme_generation import generator
+from project_database.readme_generation.adapters.mock_adapters import (
+    MockLLMAdapter,
+    MockEmbeddingAdapter,
+    MockVectorStoreAdapter
+)
+
+
+# Test fixtures path
+FIXTURES_DIR = Path(__file__).parent / 'fixtures'
+
+
+@pytest.fixture
+def mock_adapters(monkeypatch):
+    """Make generate_readme_for_project build mock adapters instead of Ollama and ChromaDB ones."""
+    llm, embedder, vector_store = MockLLMAdapter(), MockEmbeddingAdapter(), MockVectorStoreAdapter()
+    monkeypatch.setattr(generator, 'OllamaLLMAdapter', lambda config: llm)
+    monkeypatch.setattr(generator, 'OllamaEmbeddingAdapter', lambda config: embedder)
+    monkeypatch.setattr(generator, 'ChromaDBAdapter', lambda config: vector_store)
+    return llm, embedder, vector_store
+
+
+def generate(project_path, tmp_path):
+    return generator.generate_readme_for_project(
+        str(project_path),
+        output_path=str(tmp_path / 'README_GENERATED.md'),
+        ollama_host='http://localhost:11434',
+        db_path=str(tmp_path / 'db'),
+        use_cache=False
+    )
+
+
+def test_small_project_skips_indexing(mock_adapters, tmp_path):
+    """A project with few chunks should be put in the prompt whole, without embedding."""
+    llm, embedder, vector_store = mock_adapters
+    project = tmp_path / 'small-project'
+    project.mkdir()
+    (project / 'main.py').write_text('def main():\n    return 1\n')
+
+    readme = generate(project, tmp_path)
+
+    assert readme == (tmp_path / 'README_GENERATED.md').read_text()
+    assert llm.call_count == 1
+    assert 'def main()' in llm.last_user_prompt
+    assert embedder.embedded_texts == []
+    assert vector_store.collections == {}
+
+
+def test_larger_project_is_indexed(mock_adapters, tmp_path):
+    """A project with more chunks than the bypass threshold should be indexed and queried."""
+    llm, embedder, vector_store = mock_adapters
+
+    generate(FIXTURES_DIR, tmp_path)
+
+    assert llm.call_count == 1
+    assert len(vector_store.collections) == 1
+    assert embedder.embedded_texts
+
+
+def test_project_without_python_files_leaves_no_collection(mock_adapters, tmp_path):
+    """A project with no Python files should return None without touching the vector store."""
+    llm, _, vector_store = mock_adapters
+    project = tmp_path / 'empty-project'
+    project.mkdir()
+
+    assert generate(project, tmp_path) is None
+    assert llm.call_count == 0
+    assert vector_store.collections == {}
@@ -11,6 +11,7 @@ Skip with: pytest -m "not integration"
 import pytest
 import os
 from pathlib import Path
+import ollama
 from dotenv import load_dotenv
 
 from project_database.readme_generation import (
@@ -36,8 +37,11 @@ from project_database.readme_generation.rag_pipeline import ReadmeGenerator
 # Test fixtures path
 FIXTURES_DIR = Path(__file__).parent / 'fixtures'
 
+# Under pytest-xdist (--dist loadgroup), keep all Ollama tests on one worker
+pytestmark = pytest.mark.xdist_group("ollama")
 
-@pytest.fixture
+
+@pytest.fixture(scope="session")
 def ollama_host():
     """Get Ollama host from environment."""
     load_dotenv()
@@ -47,20 +51,31 @@ def ollama_host():
     return host
 
 
-@pytest.fixture
-def config(ollama_host):
-    """Create configuration for integration tests."""
+@pytest.fixture(scope="session")
+def ollama_alive(ollama_host):
+    """Probe Ollama once with a short timeout, skipping its tests if it is unreachable."""
+    try:
+        # list() requests /api/tags, which is cheap and needs no model loaded
+        ollama.Client(host=ollama_host, timeout=2.0).list()
+    except Exception as e:
+        pytest.skip(f"Ollama unreachable at {ollama_host}: {e}")
+    return True
+
+
+@pytest.fixture(scope="session")
+def config(ollama_host, tmp_path_factory):
+    """Create configuration for integration tests, with a fresh ChromaDB directory per session."""
     return Config(
         ollama_host=ollama_host,
         llm_model='qwen2.5-coder:7b',
         embed_model='nomic-embed-text',
-        db_path='./test_chroma_db'
+        db_path=str(tmp_path_factory.mktemp("chroma"))
     )
 
 
-@pytest.fixture
-def adapters(config):
-    """Create real adapters for integration testing."""
+@pytest.fixture(scope="session")
+def adapters(config, ollama_alive):
+    """Create real adapters once, so HTTP connections and the ChromaDB client are reused."""
     llm = OllamaLLMAdapter(config)
     embedder = OllamaEmbeddingAdapter(config)
     vector_store = ChromaDBAdapter(config)
@@ -120,9 +135,9 @@ def test_complete_readme_generation_pipeline(readme_generator):
 
 
 @pytest.mark.integration
-def test_ollama_llm_adapter_connectivity(config):
+def test_ollama_llm_adapter_connectivity(adapters):
     """Test that we can connect to Ollama LLM."""
-    llm = OllamaLLMAdapter(config)
+    llm, _, _ = adapters
 
     response = llm.generate(
         system_prompt="You are a helpful assistant.",
@@ -137,9 +152,26 @@ def test_ollama_llm_adapter_connectivity(config):
 
 
 @pytest.mark.integration
-def test_ollama_embedding_adapter_connectivity(config):
+def test_ollama_llm_adapter_streams_until_stop(adapters):
+    """Test that streamed generation ends before the stop string."""
+    llm, _, _ = adapters
+
+    pieces = list(llm.stream_generate(
+        system_prompt="You are a helpful assistant.",
+        user_prompt="Write two short lines of text.",
+        stop="\n",
+        temperature=0.1,
+        num_predict=40
+    ))
+
+    assert all(isinstance(piece, str) for piece in pieces)
+    assert "\n" not in "".join(pieces)
+
+
+@pytest.mark.integration
+def test_ollama_embedding_adapter_connectivity(adapters):
     """Test that we can generate embeddings via Ollama."""
-    embedder = OllamaEmbeddingAdapter(config)
+    _, embedder, _ = adapters
 
     embedding = embedder.embed("This is a test sentence.")
 
@@ -150,9 +182,22 @@ def test_ollama_embedding_adapter_connectivity(config):
 
 
 @pytest.mark.integration
-def test_chromadb_adapter_storage_and_retrieval(config):
+def test_ollama_embedding_adapter_batch(adapters):
+    """Test that one batched embedding request matches per-text embeddings."""
+    _, embedder, _ = adapters
+    texts = ["def hello(): return 'Hello'", "class TestClass: pass"]
+
+    embeddings = embedder.embed_batch(texts)
+
+    assert len(embeddings) == len(texts)
+    for text, embedding in zip(texts, embeddings):
+        assert embedding == pytest.approx(embedder.embed(text), abs=1e-4)
+
+
+@pytest.mark.integration
+def test_chromadb_adapter_storage_and_retrieval(adapters):
     """Test ChromaDB adapter can store and retrieve chunks."""
-    vector_store = ChromaDBAdapter(config)
+    _, _, vector_store = adapters
 
     # Create test collection
     collection = vector_store.create_collection("test_collection")
@@ -187,4 +232,53 @@ def test_chromadb_adapter_storage_and_retrieval(config):
     )
 
     assert results is not None
-    assert len(results) > 0
\ No newline at end of file
+    assert len(results) > 0
+
+
+@pytest.mark.integration
+def test_chromadb_adapter_adds_in_batches(config):
+    """Test ChromaDB adapter stores every chunk when splitting into sub-batches."""
+    batched_config = Config(
+        ollama_host=config.ollama_host,
+        db_path=config.db_path,
+        add_batch_size=2
+    )
+    vector_store = ChromaDBAdapter(batched_config)
+
+    collection = vector_store.create_collection("test_batched_collection")
+
+    documents = [f"def func_{i}(): pass" for i in range(5)]
+    embeddings = [[float(i), 0.5, 0.5] for i in range(5)]
+    metadatas = [{'type': 'function', 'name': f'func_{i}'} for i in range(5)]
+    ids = [f'chunk_{i}' for i in range(5)]
+
+    vector_store.add_chunks(
+        collection=collection,
+        documents=documents,
+        embeddings=embeddings,
+        metadatas=metadatas,
+        ids=ids
+    )
+
+    assert collection.count() == 5
+
+
+@pytest.mark.integration
+def test_chromadb_adapter_keeps_collection_between_runs(config, adapters):
+    """Test ChromaDB adapter reuses a collection and can prune chunks from it."""
+    _, _, vector_store = adapters
+
+    collection = vector_store.create_collection("test_persistent_collection")
+    vector_store.add_chunks(
+        collection=collection,
+        documents=["def a(): pass", "def b(): pass"],
+        embeddings=[[0.1, 0.2, 0.3], [0.4, 0.5, 0.6]],
+        metadatas=[{'name': 'a'}, {'name': 'b'}],
+        ids=['chunk_a', 'chunk_b']
+    )
+
+    collection = ChromaDBAdapter(config).create_collection("test_persistent_collection")
+    assert sorted(vector_store.get_ids(collection)) == ['chunk_a', 'chunk_b']
+
+    vector_store.delete_chunks(collection, ['chunk_a'])
+    assert vector_store.get_ids(collection) == ['chunk_b']
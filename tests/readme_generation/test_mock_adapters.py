@@ -1,5 +1,6 @@
 """Tests for mock adapters."""
 
+import numpy as np
 from project_database.readme_generation.ports import LLMPort, EmbeddingPort, VectorStorePort
 from project_database.readme_generation.adapters.mock_adapters import (
     MockLLMAdapter,
@@ -43,6 +44,14 @@ def test_mock_llm_tracks_calls():
     assert adapter.call_count == 2
 
 
+def test_mock_llm_streams_whole_response():
+    """MockLLMAdapter should stream its canned response through the port default."""
+    adapter = MockLLMAdapter(canned_response="# Streamed")
+
+    assert list(adapter.stream_generate("sys prompt", "user prompt")) == ["# Streamed"]
+    assert adapter.call_count == 1
+
+
 def test_mock_embedding_implements_port():
     """MockEmbeddingAdapter should implement EmbeddingPort."""
     adapter = MockEmbeddingAdapter()
@@ -70,6 +79,46 @@ def test_mock_embedding_deterministic():
     assert result1 == result2
 
 
+def test_mock_embedding_values_follow_text_hash():
+    """MockEmbeddingAdapter element i should be ((hash(text) + i) % 1000) / 1000."""
+    adapter = MockEmbeddingAdapter(embedding_dim=16)
+
+    result = adapter.embed("test text")
+
+    expected = [float((hash("test text") + i) % 1000) / 1000.0 for i in range(16)]
+    assert result == expected
+
+
+def test_mock_embedding_repeat_calls_are_independent_copies():
+    """MockEmbeddingAdapter should count repeat calls and not share returned lists."""
+    adapter = MockEmbeddingAdapter()
+
+    first = adapter.embed("test")
+    first[0] = -1.0
+    second = adapter.embed("test")
+
+    assert second[0] != -1.0
+    assert adapter.call_count == 2
+    assert adapter.embedded_texts == ["test", "test"]
+
+
+def test_mock_embedding_fp16_roundtrip():
+    """MockEmbeddingAdapter should produce float16 vectors when asked."""
+    adapter = MockEmbeddingAdapter(embedding_dim=16, dtype='float16')
+
+    assert len(adapter.embed("test")) == 16
+    assert adapter.embed_array("test").dtype == np.float16
+    assert np.allclose(adapter.embed("test"), MockEmbeddingAdapter(embedding_dim=16).embed("test"), atol=1e-3)
+
+
+def test_mock_embedding_int8_dequantizes():
+    """MockEmbeddingAdapter should return int8 codes from embed_array and scaled floats from embed."""
+    adapter = MockEmbeddingAdapter(embedding_dim=16, dtype='int8')
+
+    assert adapter.embed_array("test").dtype == np.int8
+    assert np.allclose(adapter.embed("test"), MockEmbeddingAdapter(embedding_dim=16).embed("test"), atol=0.01)
+
+
 def test_mock_embedding_tracks_calls():
     """MockEmbeddingAdapter should track embedded texts."""
     adapter = MockEmbeddingAdapter()
@@ -84,6 +133,26 @@ def test_mock_embedding_tracks_calls():
     assert "text 2" in adapter.embedded_texts
 
 
+def test_mock_embedding_batch_matches_single_embeddings():
+    """MockEmbeddingAdapter.embed_batch should return one vector per text, in order."""
+    adapter = MockEmbeddingAdapter()
+
+    result = adapter.embed_batch(["text 1", "text 2"])
+
+    assert result == [adapter.embed("text 1"), adapter.embed("text 2")]
+
+
+def test_mock_embedding_batch_tracks_calls():
+    """MockEmbeddingAdapter should count a batch as a single call."""
+    adapter = MockEmbeddingAdapter()
+
+    adapter.embed_batch(["text 1", "text 2", "text 3"])
+
+    assert adapter.batch_count == 1
+    assert adapter.call_count == 0
+    assert adapter.embedded_texts == ["text 1", "text 2", "text 3"]
+
+
 def test_mock_vector_store_implements_port():
     """MockVectorStoreAdapter should implement VectorStorePort."""
     adapter = MockVectorStoreAdapter()
@@ -122,6 +191,63 @@ def test_mock_vector_store_adds_and_queries():
     assert results[1] == "doc2"
 
 
+def test_mock_vector_store_ranks_by_similarity():
+    """MockVectorStoreAdapter should return the most similar documents first."""
+    adapter = MockVectorStoreAdapter()
+
+    collection = adapter.create_collection("test")
+    adapter.add_chunks(
+        collection,
+        ["east", "north", "north-east"],
+        [[1.0, 0.0], [0.0, 1.0], [0.7, 0.7]],
+        [{}, {}, {}],
+        ["id1", "id2", "id3"]
+    )
+
+    assert adapter.query(collection, [0.0, 2.0], n_results=2) == ["north", "north-east"]
+    assert adapter.query(collection, [1.0, 0.1], n_results=5) == ["east", "north-east", "north"]
+
+
+def test_mock_vector_store_stores_float32_matrix():
+    """MockVectorStoreAdapter should keep embeddings as one float32 row per chunk."""
+    adapter = MockVectorStoreAdapter()
+
+    collection = adapter.create_collection("test")
+    adapter.add_chunks(collection, ["doc1"], [[0.1, 0.2]], [{}], ["id1"])
+    adapter.add_chunks(collection, ["doc2", "doc3"], [[0.3, 0.4], [0.5, 0.6]], [{}, {}], ["id2", "id3"])
+
+    embeddings = adapter.collections["test"]['embeddings']
+    assert embeddings.dtype == np.float32
+    assert embeddings.shape == (3, 2)
+
+
+def test_mock_vector_store_skips_existing_ids():
+    """MockVectorStoreAdapter should not store a chunk ID twice."""
+    adapter = MockVectorStoreAdapter()
+
+    collection = adapter.create_collection("test")
+    adapter.add_chunks(collection, ["doc1"], [[0.1]], [{}], ["id1"])
+    adapter.add_chunks(collection, ["doc1", "doc2"], [[0.1], [0.2]], [{}, {}], ["id1", "id2"])
+
+    assert adapter.get_ids(collection) == ["id1", "id2"]
+    assert adapter.collections["test"]['documents'] == ["doc1", "doc2"]
+
+
+def test_mock_vector_store_deletes_chunks():
+    """MockVectorStoreAdapter should remove chunks by ID."""
+    adapter = MockVectorStoreAdapter()
+
+    collection = adapter.create_collection("test")
+    adapter.add_chunks(
+        collection, ["doc1", "doc2", "doc3"], [[0.1], [0.2], [0.3]], [{}, {}, {}], ["id1", "id2", "id3"]
+    )
+
+    adapter.delete_chunks(collection, ["id2"])
+
+    assert adapter.get_ids(collection) == ["id1", "id3"]
+    assert adapter.query(collection, [0.1], n_results=5) == ["doc1", "doc3"]
+
+
 def test_mock_vector_store_multiple_collections():
     """MockVectorStoreAdapter should handle multiple collections."""
     adapter = MockVectorStoreAdapter()
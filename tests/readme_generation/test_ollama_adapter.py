@@ -0,0 +1,75 @@
+"""Tests for Ollama adapters using a stub client."""
+
+from project_database.readme_generation import Config
+from project_database.readme_generation.adapters.ollama_adapter import OllamaLLMAdapter
+
+
+class StubChatClient:
+    """Stands in for ollama.Client, streaming canned pieces from chat."""
+
+    def __init__(self, pieces):
+        self.pieces = pieces
+        self.read = 0
+        self.closed = False
+        self.last_options = None
+
+    def chat(self, model, messages, options, stream):
+        assert stream
+        self.last_options = options
+        return self._stream()
+
+    def _stream(self):
+        try:
+            for piece in self.pieces:
+                self.read += 1
+                yield {'message': {'content': piece}}
+        finally:
+            self.closed = True
+
+
+def make_llm(pieces):
+    llm = OllamaLLMAdapter(Config(ollama_host='http://localhost:11434'))
+    llm.client = StubChatClient(pieces)
+    return llm
+
+
+def test_generate_joins_streamed_pieces():
+    """generate should return the whole streamed response."""
+    llm = make_llm(['Hel', 'lo', ' world'])
+
+    assert llm.generate("system", "user", temperature=0.1) == 'Hello world'
+    assert llm.client.last_options == {'temperature': 0.1}
+
+
+def test_stream_generate_yields_pieces_as_they_arrive():
+    """stream_generate should yield each piece before reading the next."""
+    llm = make_llm(['Hel', 'lo'])
+
+    stream = llm.stream_generate("system", "user")
+
+    assert next(stream) == 'Hel'
+    assert llm.client.read == 1
+
+
+def test_stream_generate_stops_at_stop_string():
+    """stream_generate should end before the stop string and close the stream."""
+    llm = make_llm(['Hello', '\nmore', ' text', ' unread'])
+
+    assert ''.join(llm.stream_generate("system", "user", stop='\n')) == 'Hello'
+    assert llm.client.read == 2
+    assert llm.client.closed
+    assert llm.client.last_options == {'stop': ['\n']}
+
+
+def test_stream_generate_finds_stop_split_across_pieces():
+    """stream_generate should not emit part of a stop string split across pieces."""
+    llm = make_llm(['Hello', ' EN', 'D tail'])
+
+    assert llm.generate("system", "user", stop=' END') == 'Hello'
+
+
+def test_stream_generate_without_stop_string_match():
+    """stream_generate should return everything when the stop string never appears."""
+    llm = make_llm(['ab', 'c', 'de'])
+
+    assert llm.generate("system", "user", stop='xyz') == 'abcde'
@@ -1,7 +1,8 @@
 """Tests for RAG pipeline using mock adapters."""
 
-from pathlib import Path
-from project_database.readme_generation import CodeAnalyzer, chunk_project, Config
+import math
+import numpy as np
+from project_database.readme_generation import Config
 from project_database.readme_generation.adapters.mock_adapters import (
     MockLLMAdapter,
     MockEmbeddingAdapter,
@@ -10,16 +11,9 @@ from project_database.readme_generation.adapters.mock_adapters import (
 from project_database.readme_generation.rag_pipeline import ReadmeGenerator
 
 
-# Test fixtures path
-FIXTURES_DIR = Path(__file__).parent / 'fixtures'
-
-
-def test_readme_generator_initialization():
+def test_readme_generator_initialization(config, mocks):
     """ReadmeGenerator should initialize with ports."""
-    config = Config(ollama_host='http://localhost:11434')
-    llm = MockLLMAdapter()
-    embedder = MockEmbeddingAdapter()
-    vector_store = MockVectorStoreAdapter()
+    llm, embedder, vector_store = mocks
 
     generator = ReadmeGenerator(
         llm=llm,
@@ -34,85 +28,88 @@ def test_readme_generator_initialization():
     assert generator.vector_store == vector_store
 
 
-def test_readme_generator_generates_readme():
+def test_readme_generator_generates_readme(config, project_info, project_chunks):
     """ReadmeGenerator should generate README from project info and chunks."""
-    config = Config(ollama_host='http://localhost:11434')
     llm = MockLLMAdapter(canned_response="# Test Project\nGenerated README")
     embedder = MockEmbeddingAdapter()
     vector_store = MockVectorStoreAdapter()
 
     generator = ReadmeGenerator(llm, embedder, vector_store, config)
 
-    # Analyze and chunk test project
-    analyzer = CodeAnalyzer()
-    project_info = analyzer.analyze_project(str(FIXTURES_DIR))
-    chunks = chunk_project(project_info)
-
     # Generate README
-    readme = generator.generate_readme(project_info, chunks)
+    readme = generator.generate_readme(project_info, project_chunks)
 
     assert readme is not None
     assert "Test Project" in readme
     assert "Generated README" in readme
 
 
-def test_readme_generator_calls_llm():
+def test_readme_generator_calls_llm(config, mocks, project_info, project_chunks):
     """ReadmeGenerator should call LLM during generation."""
-    config = Config(ollama_host='http://localhost:11434')
-    llm = MockLLMAdapter()
-    embedder = MockEmbeddingAdapter()
-    vector_store = MockVectorStoreAdapter()
+    llm, embedder, vector_store = mocks
 
     generator = ReadmeGenerator(llm, embedder, vector_store, config)
 
-    analyzer = CodeAnalyzer()
-    project_info = analyzer.analyze_project(str(FIXTURES_DIR))
-    chunks = chunk_project(project_info)
-
     assert llm.call_count == 0
 
-    generator.generate_readme(project_info, chunks)
+    generator.generate_readme(project_info, project_chunks)
 
     assert llm.call_count == 1
     assert llm.last_system_prompt is not None
     assert llm.last_user_prompt is not None
 
 
-def test_readme_generator_calls_embedder():
+def test_readme_generator_calls_embedder(config, mocks, project_info, project_chunks):
     """ReadmeGenerator should call embedder for chunks and queries."""
-    config = Config(ollama_host='http://localhost:11434')
-    llm = MockLLMAdapter()
-    embedder = MockEmbeddingAdapter()
-    vector_store = MockVectorStoreAdapter()
+    llm, embedder, vector_store = mocks
 
     generator = ReadmeGenerator(llm, embedder, vector_store, config)
 
-    analyzer = CodeAnalyzer()
-    project_info = analyzer.analyze_project(str(FIXTURES_DIR))
-    chunks = chunk_project(project_info)
-
     assert embedder.call_count == 0
 
-    generator.generate_readme(project_info, chunks)
+    generator.generate_readme(project_info, project_chunks)
 
-    # Should embed all chunks + 1 query embedding
-    assert embedder.call_count == len(chunks) + 1
+    # Should embed all chunks in one batch + 1 query embedding
+    assert embedder.batch_count == 1
+    assert embedder.call_count == 1
+    assert len(embedder.embedded_texts) == len(project_chunks) + 1
 
 
-def test_readme_generator_uses_vector_store():
-    """ReadmeGenerator should store chunks and query vector store."""
-    config = Config(ollama_host='http://localhost:11434')
-    llm = MockLLMAdapter()
-    embedder = MockEmbeddingAdapter()
-    vector_store = MockVectorStoreAdapter()
+def test_readme_generator_batches_embeddings_by_config_size(mocks, project_info, project_chunks):
+    """ReadmeGenerator should split chunk embedding into config-sized batches."""
+    config = Config(ollama_host='http://localhost:11434', embed_batch_size=3, max_concurrency=1)
+    llm, embedder, vector_store = mocks
 
     generator = ReadmeGenerator(llm, embedder, vector_store, config)
 
-    analyzer = CodeAnalyzer()
-    project_info = analyzer.analyze_project(str(FIXTURES_DIR))
-    chunks = chunk_project(project_info)
+    generator.generate_readme(project_info, project_chunks)
+
+    assert embedder.batch_count == math.ceil(len(project_chunks) / 3)
+
+
+def test_readme_generator_keeps_embeddings_aligned_when_concurrent(mocks, project_info, project_chunks):
+    """ReadmeGenerator should store each chunk with its own embedding when batches run concurrently."""
+    config = Config(ollama_host='http://localhost:11434', embed_batch_size=2, max_concurrency=4)
+    llm, embedder, vector_store = mocks
+
+    generator = ReadmeGenerator(llm, embedder, vector_store, config)
+
+    generator.generate_readme(project_info, project_chunks)
+
+    collection = list(vector_store.collections.values())[0]
+    assert collection['documents'] == [c['content'] for c in project_chunks]
+    assert np.allclose(collection['embeddings'], [
+        MockEmbeddingAdapter().embed(c['content']) for c in project_chunks
+    ])
 
-    generator.generate_readme(project_info, chunks)
+
+def test_readme_generator_uses_vector_store(config, mocks, project_info, project_chunks):
+    """ReadmeGenerator should store chunks and query vector store."""
+    llm, embedder, vector_store = mocks
+
+    generator = ReadmeGenerator(llm, embedder, vector_store, config)
+
+    generator.generate_readme(project_info, project_chunks)
 
     # Should have created a collection
     assert len(vector_store.collections) > 0
@@ -120,16 +117,141 @@ def test_readme_generator_uses_vector_store():
     # Should have stored chunks
     collection_name = list(vector_store.collections.keys())[0]
     collection = vector_store.collections[collection_name]
-    assert len(collection['documents']) == len(chunks)
+    assert len(collection['documents']) == len(project_chunks)
 
 
-def test_readme_generator_with_empty_project():
-    """ReadmeGenerator should handle projects with no files gracefully."""
-    config = Config(ollama_host='http://localhost:11434')
-    llm = MockLLMAdapter()
+def test_readme_generator_reindexes_only_changed_chunks(config, mocks, project_info, project_chunks):
+    """ReadmeGenerator should keep unchanged chunks and drop removed ones on re-runs."""
+    llm, embedder, vector_store = mocks
+
+    generator = ReadmeGenerator(llm, embedder, vector_store, config)
+
+    generator.generate_readme(project_info, project_chunks)
+    changed = project_chunks[1:] + [dict(project_chunks[0], content='# Changed content')]
+    generator.generate_readme(project_info, changed)
+
+    collection = list(vector_store.collections.values())[0]
+    assert sorted(collection['documents']) == sorted(c['content'] for c in changed)
+
+
+def test_readme_generator_indexes_chunks_as_they_arrive(project_info, project_chunks):
+    """ReadmeGenerator should embed earlier batches before the chunk stream is exhausted."""
+    config = Config(ollama_host='http://localhost:11434', embed_batch_size=2, max_concurrency=1)
+    embedder = MockEmbeddingAdapter()
+    vector_store = MockVectorStoreAdapter()
+
+    generator = ReadmeGenerator(MockLLMAdapter(), embedder, vector_store, config)
+
+    embedded_before = []
+
+    def stream():
+        for chunk in project_chunks:
+            embedded_before.append(len(embedder.embedded_texts))
+            yield chunk
+
+    collection, chunk_count = generator.index_chunks(project_info['project_name'], stream())
+
+    assert chunk_count == len(project_chunks)
+    assert embedded_before[-1] > 0
+    assert len(vector_store.get_ids(collection)) == len(project_chunks)
+
+    readme = generator.generate_from_index(project_info, collection, chunk_count)
+    assert readme is not None
+
+
+def test_readme_generator_embeds_query_once(config, project_info, project_chunks):
+    """ReadmeGenerator should reuse the query embedding across README generations."""
+    embedder = MockEmbeddingAdapter()
+
+    generator = ReadmeGenerator(MockLLMAdapter(), embedder, MockVectorStoreAdapter(), config)
+
+    generator.generate_readme(project_info, project_chunks)
+    generator.generate_readme(project_info, project_chunks)
+
+    assert embedder.call_count == 1
+
+
+def test_readme_generator_skips_retrieval_for_small_projects(mocks, project_info, project_chunks):
+    """ReadmeGenerator should put all chunks in the prompt when there are only a few."""
+    config = Config(ollama_host='http://localhost:11434', rag_bypass_threshold=100)
+    llm, embedder, vector_store = mocks
+
+    generator = ReadmeGenerator(llm, embedder, vector_store, config)
+
+    generator.generate_readme(project_info, project_chunks)
+
+    assert embedder.call_count == 0
+    assert embedder.batch_count == 0
+    assert vector_store.collections == {}
+    assert all(chunk['content'] in llm.last_user_prompt for chunk in project_chunks)
+
+
+def test_readme_generator_embeds_only_new_chunks(config, project_info, project_chunks):
+    """ReadmeGenerator should not embed chunks already stored by an earlier run."""
     embedder = MockEmbeddingAdapter()
     vector_store = MockVectorStoreAdapter()
 
+    ReadmeGenerator(MockLLMAdapter(), embedder, vector_store, config).generate_readme(project_info, project_chunks)
+    embedder.embedded_texts.clear()
+
+    changed = project_chunks + [dict(project_chunks[0], content='# New content')]
+    ReadmeGenerator(MockLLMAdapter(), embedder, vector_store, config).generate_readme(project_info, changed)
+
+    assert embedder.embedded_texts == ['# New content', ReadmeGenerator.DEFAULT_QUERY]
+
+
+def test_readme_generator_embeds_repeated_content_once(config, mocks, project_info):
+    """ReadmeGenerator should embed identical chunks from different files once and store each."""
+    llm, embedder, vector_store = mocks
+    chunks = [
+        {'type': 'module', 'filepath': f'pkg/mod{i}.py', 'content': 'import os\nimport sys'}
+        for i in range(3)
+    ] + [{'type': 'module', 'filepath': f'pkg/other{i}.py', 'content': f'X = {i}'} for i in range(3)]
+
+    generator = ReadmeGenerator(llm, embedder, vector_store, config)
+    collection, chunk_count = generator.index_chunks(project_info['project_name'], chunks)
+
+    assert chunk_count == len(chunks)
+    assert sorted(embedder.embedded_texts) == sorted({c['content'] for c in chunks})
+    stored = vector_store.collections[collection]
+    assert len(stored['documents']) == len(chunks)
+    assert np.allclose(stored['embeddings'], [embedder.embed(c['content']) for c in chunks])
+
+
+def test_readme_generator_keeps_embedding_models_apart(project_info, project_chunks):
+    """ReadmeGenerator should not reuse vectors stored for a different embedding model."""
+    vector_store = MockVectorStoreAdapter()
+    small = Config(ollama_host='http://localhost:11434', embed_model='small-embed')
+    large = Config(ollama_host='http://localhost:11434', embed_model='large-embed')
+
+    first = ReadmeGenerator(MockLLMAdapter(), MockEmbeddingAdapter(embedding_dim=384), vector_store, small)
+    first.generate_readme(project_info, project_chunks)
+
+    large_embedder = MockEmbeddingAdapter(embedding_dim=768)
+    second = ReadmeGenerator(MockLLMAdapter(), large_embedder, vector_store, large)
+    readme = second.generate_readme(project_info, project_chunks)
+
+    assert readme is not None
+    assert len(vector_store.collections) == 2
+    assert len(large_embedder.embedded_texts) == len(project_chunks) + 1
+
+
+def test_readme_generator_creates_no_collection_without_chunks(config, mocks, project_info):
+    """ReadmeGenerator should not create a collection for a project with no chunks."""
+    llm, embedder, vector_store = mocks
+
+    generator = ReadmeGenerator(llm, embedder, vector_store, config)
+    collection, chunk_count = generator.index_chunks(project_info['project_name'], iter([]))
+
+    assert (collection, chunk_count) == (None, 0)
+    assert vector_store.collections == {}
+    assert generator.generate_from_index(project_info, collection, chunk_count) is not None
+
+
+def test_readme_generator_with_empty_project(config, mocks):
+    """ReadmeGenerator should handle projects with no files gracefully."""
+    llm, embedder, vector_store = mocks
+
     generator = ReadmeGenerator(llm, embedder, vector_store, config)
 
     # Empty project info
@@ -145,4 +267,13 @@ def test_readme_generator_with_empty_project():
 
     # Should not crash
     readme = generator.generate_readme(project_info, chunks)
-    assert readme is not None
\ No newline at end of file
+    assert readme is not None
+
+
+def test_readme_prompt_lists_components(config):
+    """The README prompt should number each context chunk on its own header line."""
+    generator = ReadmeGenerator(MockLLMAdapter(), MockEmbeddingAdapter(), MockVectorStoreAdapter(), config)
+
+    prompt = generator._build_readme_prompt("Project: demo\n", ["def a(): pass", "def b(): pass"])
+
+    assert "--- Component 1 ---\ndef a(): pass\n--- Component 2 ---\ndef b(): pass\n" in prompt
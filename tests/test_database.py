@@ -26,15 +26,10 @@ def test_init_database_creates_tables(tmp_path, monkeypatch):
     session.close()
 
 
-def test_get_session_returns_working_session(tmp_path, monkeypatch):
+def test_get_session_returns_working_session(in_memory_db):
     """Test that get_session returns a working database session."""
-    # Set DATABASE_PATH environment variable
-    db_path = tmp_path / "test.sqlite"
-    monkeypatch.setenv("DATABASE_PATH", str(db_path))
-
-    # Initialize and get session
-    init_database()
     session = get_session()
+    assert session.query(Project).all() == []
 
     # Add a project
     project = Project(name="test", path="/test/path")
@@ -42,8 +37,117 @@ def test_get_session_returns_working_session(tmp_path, monkeypatch):
     session.commit()
 
     # Retrieve it
-    retrieved = session.query(Project).filter_by(name="test").first()
+    retrieved = session.get(Project, project.id)
     assert retrieved is not None
     assert retrieved.name == "test"
 
     session.close()
+
+
+def test_init_database_accepts_database_url(tmp_path, monkeypatch):
+    """Test that DATABASE_PATH may be given as a full database URL."""
+    db_path = tmp_path / "url.sqlite"
+    monkeypatch.setenv("DATABASE_PATH", f"sqlite:///{db_path}")
+
+    init_database()
+
+    session = get_session()
+    assert session.query(Project).all() == []
+    session.close()
+    assert db_path.exists()
+
+
+def test_init_database_adds_missing_indexes(tmp_path, monkeypatch):
+    """Test that init_database adds new indexes to an existing database."""
+    from sqlalchemy import create_engine, inspect, text
+
+    db_path = tmp_path / "test.db"
+    engine = create_engine(f"sqlite:///{db_path}")
+    with engine.begin() as connection:
+        connection.execute(text(
+            "CREATE TABLE projects (id INTEGER PRIMARY KEY, name VARCHAR(255) NOT NULL, "
+            "path VARCHAR(1024) NOT NULL, readme_path VARCHAR(1024), logseq_page VARCHAR(512), "
+            "github_url VARCHAR(512), is_private BOOLEAN, created_at DATETIME NOT NULL, "
+            "updated_at DATETIME NOT NULL, last_file_modified DATETIME)"
+        ))
+    engine.dispose()
+
+    monkeypatch.setenv("DATABASE_PATH", str(db_path))
+    init_database()
+
+    engine = create_engine(f"sqlite:///{db_path}")
+    indexes = inspect(engine).get_indexes("projects")
+    engine.dispose()
+    assert {index["name"] for index in indexes} == {"ix_projects_path"}
+
+
+def test_init_database_reuses_engine_for_same_path(tmp_path, monkeypatch):
+    """Test that repeated init_database calls share one engine per database."""
+    from project_database import database
+
+    monkeypatch.setenv("DATABASE_PATH", str(tmp_path / "reuse.sqlite"))
+    init_database()
+    first = database._engine
+    init_database()
+    assert database._engine is first
+
+    monkeypatch.setenv("DATABASE_PATH", str(tmp_path / "other.sqlite"))
+    init_database()
+    assert database._engine is not first
+
+
+@pytest.mark.parametrize("database_path", [":memory:", "sqlite://"])
+def test_init_database_accepts_in_memory_database(monkeypatch, database_path):
+    """Test that an in-memory SQLite database can be used, from any thread."""
+    from concurrent.futures import ThreadPoolExecutor
+
+    monkeypatch.setenv("DATABASE_PATH", database_path)
+    init_database()
+
+    session = get_session()
+    session.add(Project(name="memory", path="/memory"))
+    session.commit()
+    session.close()
+
+    def count_projects():
+        other = get_session()
+        try:
+            return other.query(Project).count()
+        finally:
+            other.close()
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        assert executor.submit(count_projects).result() == 1
+
+
+def test_init_database_removes_duplicate_paths_before_unique_index(tmp_path, monkeypatch):
+    """Test that an old database with duplicate paths keeps the newest row per path."""
+    from sqlalchemy import create_engine, text
+
+    db_path = tmp_path / "duplicates.db"
+    engine = create_engine(f"sqlite:///{db_path}")
+    with engine.begin() as connection:
+        connection.execute(text(
+            "CREATE TABLE projects (id INTEGER PRIMARY KEY, name VARCHAR(255) NOT NULL, "
+            "path VARCHAR(1024) NOT NULL, readme_path VARCHAR(1024), logseq_page VARCHAR(512), "
+            "github_url VARCHAR(512), is_private BOOLEAN, created_at DATETIME NOT NULL, "
+            "updated_at DATETIME NOT NULL, last_file_modified DATETIME)"
+        ))
+        connection.execute(text(
+            "INSERT INTO projects (id, name, path, created_at, updated_at) VALUES "
+            "(1, 'old', '/p/a', '2024-01-01 00:00:00', '2024-01-01 00:00:00'), "
+            "(2, 'newest', '/p/a', '2024-01-01 00:00:00', '2024-06-01 00:00:00'), "
+            "(3, 'middle', '/p/a', '2024-01-01 00:00:00', '2024-03-01 00:00:00'), "
+            "(4, 'tie-low', '/p/b', '2024-01-01 00:00:00', '2024-01-01 00:00:00'), "
+            "(5, 'tie-high', '/p/b', '2024-01-01 00:00:00', '2024-01-01 00:00:00'), "
+            "(6, 'single', '/p/c', '2024-01-01 00:00:00', '2024-01-01 00:00:00')"
+        ))
+    engine.dispose()
+
+    monkeypatch.setenv("DATABASE_PATH", str(db_path))
+    init_database()
+
+    session = get_session()
+    names = {project.path: project.name for project in session.query(Project).all()}
+    session.close()
+    assert names == {"/p/a": "newest", "/p/b": "tie-high", "/p/c": "single"}
@@ -22,9 +22,7 @@ def test_scan_finds_direct_subdirectories(tmp_path):
 
     # Should find all three projects
     assert len(projects) == 3
-    assert proj1 in projects
-    assert proj2 in projects
-    assert proj3 in projects
+    assert set(projects) == {proj1, proj2, proj3}
 
 
 def test_scan_excludes_claude_directory(tmp_path):
@@ -45,6 +43,15 @@ def test_scan_excludes_claude_directory(tmp_path):
 
     # Should find only the two projects, not .claude
     assert len(projects) == 2
-    assert proj1 in projects
-    assert proj2 in projects
-    assert claude_dir not in projects
+    assert set(projects) == {proj1, proj2}
+
+
+def test_scan_ignores_files(tmp_path):
+    """Test that plain files in the parent directory are not reported as projects."""
+    parent = tmp_path / "projects"
+    parent.mkdir()
+    project = parent / "project-one"
+    project.mkdir()
+    (parent / "notes.txt").write_text("not a project")
+
+    assert scan_projects_directory(parent) == [project]
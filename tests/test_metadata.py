@@ -1,6 +1,5 @@
 """Tests for project metadata collection."""
 import pytest
-import subprocess
 from pathlib import Path
 from project_database.scanner import collect_project_metadata
 
@@ -53,13 +52,79 @@ def test_collect_metadata_parses_link_md(tmp_path):
 def test_collect_metadata_gets_github_url(tmp_path):
     """Test that collect_project_metadata extracts GitHub URL from git remote."""
     project_dir = tmp_path / "my-project"
-    project_dir.mkdir()
 
-    # Initialize git repo with GitHub remote
-    subprocess.run(["git", "init"], cwd=project_dir, capture_output=True)
-    subprocess.run(["git", "remote", "add", "origin", "https://github.com/romilly/my-project.git"],
-                   cwd=project_dir, capture_output=True)
+    # Git repo with GitHub remote; the remote is read from .git/config
+    git_dir = project_dir / ".git"
+    git_dir.mkdir(parents=True)
+    (git_dir / "config").write_text('[remote "origin"]\n\turl = https://github.com/romilly/my-project.git\n')
+
+    metadata = collect_project_metadata(project_dir)
+
+    assert metadata["github_url"] == "https://github.com/romilly/my-project"
+
+
+def test_collect_metadata_reads_git_config(tmp_path):
+    """Test that the origin URL is read from .git/config, ignoring other remotes."""
+    project_dir = tmp_path / "my-project"
+    git_dir = project_dir / ".git"
+    git_dir.mkdir(parents=True)
+    (git_dir / "config").write_text(
+        '[core]\n'
+        '\tbare = false\n'
+        '[remote "upstream"]\n'
+        '\turl = git@github.com:someone/upstream.git\n'
+        '[remote "origin"]\n'
+        '\turl = git@github.com:romilly/my-project.git\n'
+        '\tfetch = +refs/heads/*:refs/remotes/origin/*\n'
+    )
+
+    metadata = collect_project_metadata(project_dir)
+
+    assert metadata["github_url"] == "https://github.com/romilly/my-project"
+
+
+def test_collect_metadata_ignores_pushurl(tmp_path):
+    """Test that a pushurl before url in the origin section is not taken as the fetch URL."""
+    project_dir = tmp_path / "my-project"
+    git_dir = project_dir / ".git"
+    git_dir.mkdir(parents=True)
+    (git_dir / "config").write_text(
+        '[remote "origin"]\n'
+        '\tpushurl = git@github.com:someone/push-mirror.git\n'
+        '\turl = git@github.com:romilly/my-project.git\n'
+        '[remote "upstream"]\n'
+        '\turl = git@github.com:someone/upstream.git\n'
+    )
+
+    metadata = collect_project_metadata(project_dir)
+
+    assert metadata["github_url"] == "https://github.com/romilly/my-project"
+
+
+def test_collect_metadata_origin_without_url(tmp_path):
+    """Test that an origin section with no url entry does not borrow the next remote's url."""
+    project_dir = tmp_path / "my-project"
+    git_dir = project_dir / ".git"
+    git_dir.mkdir(parents=True)
+    (git_dir / "config").write_text(
+        '[remote "origin"]\n'
+        '\tpushurl = git@github.com:romilly/my-project.git\n'
+        '[remote "upstream"]\n'
+        '\turl = git@github.com:someone/upstream.git\n'
+    )
+
+    metadata = collect_project_metadata(project_dir)
+
+    assert metadata["github_url"] is None
+
+
+def test_collect_metadata_no_origin_remote(tmp_path):
+    """Test that github_url is None when the repository has no origin remote."""
+    project_dir = tmp_path / "my-project"
+    git_dir = project_dir / ".git"
+    git_dir.mkdir(parents=True)
+    (git_dir / "config").write_text('[core]\n\tbare = false\n')
 
     metadata = collect_project_metadata(project_dir)
 
-    assert metadata["github_url"] == "https://github.com/romilly/my-project"
\ No newline at end of file
+    assert metadata["github_url"] is None
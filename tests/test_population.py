@@ -1,18 +1,13 @@
 """Tests for database population."""
 import pytest
 from pathlib import Path
-from project_database.database import init_database, get_session
+from project_database.database import get_session
 from project_database.scanner import populate_database
 from project_database.models import Project
 
 
-def test_populate_database_adds_new_project(tmp_path, monkeypatch):
+def test_populate_database_adds_new_project(tmp_path, in_memory_db):
     """Test that populate_database adds a new project to the database."""
-    # Setup database
-    db_path = tmp_path / "test.db"
-    monkeypatch.setenv("DATABASE_PATH", str(db_path))
-    init_database()
-
     # Create a project directory
     projects_dir = tmp_path / "projects"
     projects_dir.mkdir()
@@ -29,3 +24,64 @@ def test_populate_database_adds_new_project(tmp_path, monkeypatch):
     assert projects[0].name == "test-project"
     assert projects[0].path == str(project_dir)
     session.close()
+
+
+def test_populate_database_skips_failing_project(tmp_path, monkeypatch, in_memory_db):
+    """Test that one failing project does not stop the others being added."""
+    from project_database import scanner
+
+    projects_dir = tmp_path / "projects"
+    projects_dir.mkdir()
+    for name in ["good-one", "broken", "good-two"]:
+        (projects_dir / name).mkdir()
+
+    collect = scanner.collect_project_metadata
+
+    def flaky_collect(project_dir):
+        if project_dir.name == "broken":
+            raise OSError("unreadable")
+        return collect(project_dir)
+
+    monkeypatch.setattr(scanner, "collect_project_metadata", flaky_collect)
+
+    populate_database(projects_dir)
+
+    session = get_session()
+    names = {project.name for project in session.query(Project).all()}
+    assert names == {"good-one", "good-two"}
+    session.close()
+
+
+def test_populate_database_updates_existing_project(tmp_path, in_memory_db):
+    """Test that re-populating updates projects in place instead of duplicating them."""
+    projects_dir = tmp_path / "projects"
+    projects_dir.mkdir()
+    project_dir = projects_dir / "test-project"
+    project_dir.mkdir()
+
+    populate_database(projects_dir)
+
+    session = get_session()
+    project = session.query(Project).one()
+    project.is_private = True
+    session.commit()
+    unchanged_updated_at = project.updated_at
+    session.close()
+
+    # Nothing changed: the row is left alone
+    populate_database(projects_dir)
+    session = get_session()
+    project = session.query(Project).one()
+    assert project.updated_at == unchanged_updated_at
+    session.close()
+
+    # README added: the row is updated, keeping columns the scanner does not collect
+    (project_dir / "README.md").write_text("# Test")
+    populate_database(projects_dir)
+
+    session = get_session()
+    project = session.query(Project).one()
+    assert project.readme_path == str(project_dir / "README.md")
+    assert project.is_private is True
+    assert project.updated_at > unchanged_updated_at
+    session.close()
@@ -1,22 +1,8 @@
 """Tests for the Project model."""
 import pytest
-import time
-from datetime import datetime, timezone
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
+from datetime import datetime, timedelta, timezone
 
-from project_database.models import Base, Project
-
-
-@pytest.fixture
-def db_session():
-    """Create an in-memory SQLite database for testing."""
-    engine = create_engine('sqlite:///:memory:')
-    Base.metadata.create_all(engine)
-    Session = sessionmaker(bind=engine)
-    session = Session()
-    yield session
-    session.close()
+from project_database.models import Project
 
 
 def test_create_project_with_all_fields(db_session):
@@ -31,10 +17,11 @@ def test_create_project_with_all_fields(db_session):
     )
 
     db_session.add(project)
-    db_session.commit()
+    db_session.flush()
+    db_session.expire(project)  # Reload from the database on next access
 
-    # Retrieve the project
-    retrieved = db_session.query(Project).filter_by(name="test-project").first()
+    # Retrieve the project by primary key, reloading the expired attributes
+    retrieved = db_session.get(Project, project.id)
 
     assert retrieved is not None
     assert retrieved.name == "test-project"
@@ -53,10 +40,11 @@ def test_create_project_with_minimal_fields(db_session):
     )
 
     db_session.add(project)
-    db_session.commit()
+    db_session.flush()
+    db_session.expire(project)  # Reload from the database on next access
 
     # Retrieve the project
-    retrieved = db_session.query(Project).filter_by(name="minimal-project").first()
+    retrieved = db_session.get(Project, project.id)
 
     assert retrieved is not None
     assert retrieved.name == "minimal-project"
@@ -77,12 +65,13 @@ def test_created_at_timestamp_auto_set(db_session):
     )
 
     db_session.add(project)
-    db_session.commit()
+    db_session.flush()
+    db_session.expire(project)  # Reload from the database on next access
 
     after_create = datetime.now()
 
     # Retrieve the project
-    retrieved = db_session.query(Project).filter_by(name="timestamp-test").first()
+    retrieved = db_session.get(Project, project.id)
 
     assert retrieved is not None
     assert retrieved.created_at is not None
@@ -103,15 +92,17 @@ def test_updated_at_timestamp_auto_updates(db_session):
     db_session.commit()
 
     # Get initial timestamps
-    retrieved = db_session.query(Project).filter_by(name="update-test").first()
+    retrieved = db_session.get(Project, project.id)
     initial_created_at = retrieved.created_at
     initial_updated_at = retrieved.updated_at
 
     assert initial_updated_at is not None
     assert isinstance(initial_updated_at, datetime)
 
-    # Wait a moment to ensure timestamp difference
-    time.sleep(0.1)
+    # Backdate the stored timestamp rather than waiting for the clock to move
+    initial_updated_at -= timedelta(days=1)
+    retrieved.updated_at = initial_updated_at
+    db_session.commit()
 
     # Update the project
     retrieved.name = "update-test-modified"
@@ -119,7 +110,8 @@ def test_updated_at_timestamp_auto_updates(db_session):
 
     # Get timestamps after update
     db_session.expire(retrieved)  # Force reload from database
-    updated_retrieved = db_session.query(Project).filter_by(name="update-test-modified").first()
+    updated_retrieved = db_session.get(Project, project.id)
+    assert updated_retrieved.name == "update-test-modified"
 
     # created_at should not change
     assert updated_retrieved.created_at == initial_created_at
@@ -140,12 +132,38 @@ def test_last_file_modified_timestamp_can_be_set(db_session):
     )
 
     db_session.add(project)
-    db_session.commit()
+    db_session.flush()
+    db_session.expire(project)  # Reload from the database on next access
 
     # Retrieve and verify
-    retrieved = db_session.query(Project).filter_by(name="file-mod-test").first()
+    retrieved = db_session.get(Project, project.id)
 
     assert retrieved is not None
     assert retrieved.last_file_modified is not None
     assert isinstance(retrieved.last_file_modified, datetime)
-    assert retrieved.last_file_modified == file_mod_time
\ No newline at end of file
+    assert retrieved.last_file_modified == file_mod_time
+
+
+def test_each_test_starts_with_empty_table(db_session):
+    """Test that projects committed by earlier tests are rolled back."""
+    assert db_session.query(Project).count() == 0
+
+
+def test_bulk_created_projects_get_timestamps(db_session, project_factory):
+    """Test that projects inserted in bulk get default timestamps."""
+    project_factory.create_batch(20)
+
+    projects = db_session.query(Project).order_by(Project.name).all()
+
+    assert len(projects) == 20
+    assert all(isinstance(project.created_at, datetime) for project in projects)
+    assert all(isinstance(project.updated_at, datetime) for project in projects)
+
+
+def test_bulk_created_projects_take_overrides(db_session, project_factory):
+    """Test that factory overrides apply to every project in the batch."""
+    rows = project_factory.create_batch(5, is_private=True)
+
+    projects = db_session.query(Project).filter_by(is_private=True).all()
+
+    assert {project.path for project in projects} == {row["path"] for row in rows}
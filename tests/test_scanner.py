@@ -1,31 +1,33 @@
 """Tests for project scanning and metadata extraction."""
 import pytest
-import subprocess
 from pathlib import Path
-from project_database.scanner import parse_logseq_link, get_github_url, collect_project_metadata
+from project_database.scanner import (
+    parse_logseq_link, parse_logseq_link_from_text, get_github_url, collect_project_metadata
+)
 
 
-def test_parse_logseq_link_from_file(tmp_path):
-    """Test parsing logseq page reference from Link.md file."""
-    # Create a Link.md file with logseq URL
-    link_file = tmp_path / "Link.md"
-    link_file.write_text("[logseq](logseq://graph/logseq-personal?page=project%2Fproject-database)")
-
-    # Parse it
-    logseq_page = parse_logseq_link(link_file)
+@pytest.mark.parametrize("content,expected", [
+    # Extracts and URL-decodes the page name
+    ("[logseq](logseq://graph/logseq-personal?page=project%2Fproject-database)", "project/project-database"),
+    ("[logseq](logseq://graph/logseq-personal?page=project%2Fmy-cool%20project)", "project/my-cool project"),
+    ("Just some random text", None),
+])
+def test_parse_logseq_link_from_text(content, expected):
+    """Test parsing logseq page reference from Link.md contents."""
+    assert parse_logseq_link_from_text(content) == expected
 
-    # Should extract and URL-decode the page name
-    assert logseq_page == "project/project-database"
 
+@pytest.fixture(scope="session")
+def logseq_link_file(tmp_path_factory):
+    """A Link.md file, written once and only read by tests."""
+    link_file = tmp_path_factory.mktemp("link") / "Link.md"
+    link_file.write_text("[logseq](logseq://graph/logseq-personal?page=project%2Fproject-database)\n")
+    return link_file
 
-def test_parse_logseq_link_with_complex_page_name(tmp_path):
-    """Test parsing logseq link with URL-encoded characters."""
-    link_file = tmp_path / "Link.md"
-    link_file.write_text("[logseq](logseq://graph/logseq-personal?page=project%2Fmy-cool%20project)")
-
-    logseq_page = parse_logseq_link(link_file)
 
-    assert logseq_page == "project/my-cool project"
+def test_parse_logseq_link_from_file(logseq_link_file):
+    """Test parsing logseq page reference from Link.md file."""
+    assert parse_logseq_link(logseq_link_file) == "project/project-database"
 
 
 def test_parse_logseq_link_file_not_found():
@@ -35,80 +37,46 @@ def test_parse_logseq_link_file_not_found():
     assert logseq_page is None
 
 
-def test_parse_logseq_link_invalid_format(tmp_path):
-    """Test parsing when Link.md has invalid format."""
-    link_file = tmp_path / "Link.md"
-    link_file.write_text("Just some random text")
-
-    logseq_page = parse_logseq_link(link_file)
-
-    assert logseq_page is None
-
-
-def test_get_github_url_https_format():
-    """Test extracting GitHub URL from HTTPS remote."""
-    remote_url = "https://github.com/romilly/project-database.git"
-    github_url = get_github_url(remote_url)
-    assert github_url == "https://github.com/romilly/project-database"
-
-
-def test_get_github_url_ssh_format():
-    """Test extracting GitHub URL from SSH remote."""
-    remote_url = "git@github.com:romilly/project-database.git"
-    github_url = get_github_url(remote_url)
-    assert github_url == "https://github.com/romilly/project-database"
-
-
-def test_get_github_url_non_github_remote():
-    """Test with non-GitHub remote returns None."""
-    remote_url = "https://gitlab.com/user/project.git"
-    github_url = get_github_url(remote_url)
-    assert github_url is None
-
-
-def test_get_github_url_none():
-    """Test with None input returns None."""
-    github_url = get_github_url(None)
-    assert github_url is None
+@pytest.mark.parametrize("remote_url,expected", [
+    ("https://github.com/romilly/project-database.git", "https://github.com/romilly/project-database"),
+    ("git@github.com:romilly/project-database.git", "https://github.com/romilly/project-database"),
+    ("https://gitlab.com/user/project.git", None),
+    (None, None),
+])
+def test_get_github_url(remote_url, expected):
+    """Test extracting GitHub URL from HTTPS and SSH remotes, and rejecting others."""
+    assert get_github_url(remote_url) == expected
 
 
 def test_get_last_file_modified_time(tmp_path):
     """Test finding the most recent file modification time in a directory."""
     from project_database.scanner import get_last_file_modified_time
     from datetime import datetime
-    import time
+    import os
 
     # Create a project directory with some files
     project_dir = tmp_path / "test-project"
     project_dir.mkdir()
 
-    # Create an old file
+    # Create an old file and a newer file, with explicit modification times
     old_file = project_dir / "old.txt"
     old_file.write_text("old")
-    old_time = datetime.fromtimestamp(old_file.stat().st_mtime)
+    os.utime(old_file, (1_600_000_000, 1_600_000_000))
 
-    # Wait a bit
-    time.sleep(0.1)
-
-    # Create a newer file
     new_file = project_dir / "new.txt"
     new_file.write_text("new")
-    new_time = datetime.fromtimestamp(new_file.stat().st_mtime)
-
-    # Get the most recent modification time
-    last_modified = get_last_file_modified_time(project_dir)
+    os.utime(new_file, (1_600_000_010, 1_600_000_010))
 
     # Should return the newer time
-    assert last_modified is not None
-    assert last_modified >= old_time
-    assert abs((last_modified - new_time).total_seconds()) < 1  # Within 1 second
+    assert get_last_file_modified_time(project_dir) == datetime.fromtimestamp(1_600_000_010)
 
 
-def test_get_last_file_modified_time_excludes_venv(tmp_path):
-    """Test that venv directory is excluded from file modification scan."""
+@pytest.mark.parametrize("excluded", ["venv", ".venv", ".git", "node_modules", "__pycache__"])
+def test_get_last_file_modified_time_excludes_venv(tmp_path, excluded):
+    """Test that virtualenv, git and cache directories are excluded from file modification scan."""
     from project_database.scanner import get_last_file_modified_time
     from datetime import datetime
-    import time
+    import os
 
     # Create project directory
     project_dir = tmp_path / "test-project"
@@ -117,19 +85,73 @@ def test_get_last_file_modified_time_excludes_venv(tmp_path):
     # Create a file in the main directory
     main_file = project_dir / "main.txt"
     main_file.write_text("main")
-    main_time = datetime.fromtimestamp(main_file.stat().st_mtime)
+    os.utime(main_file, (1_600_000_000, 1_600_000_000))
+
+    # Create excluded directory with a newer, nested file (should be ignored)
+    excluded_file = project_dir / excluded / "sub" / "newer.txt"
+    excluded_file.parent.mkdir(parents=True)
+    excluded_file.write_text("newer in excluded directory")
+    os.utime(excluded_file, (1_600_000_010, 1_600_000_010))
+
+    # Should return main_time, not the excluded file time
+    assert get_last_file_modified_time(project_dir) == datetime.fromtimestamp(1_600_000_000)
+
+
+def test_get_last_file_modified_time_searches_subdirectories(tmp_path):
+    """Test that files in nested directories are considered, and excluded ones are not."""
+    from project_database.scanner import get_last_file_modified_time
+    from datetime import datetime
+    import os
+
+    project_dir = tmp_path / "test-project"
+    nested = project_dir / "src" / "package"
+    nested.mkdir(parents=True)
+    (project_dir / "top.txt").write_text("top")
+    nested_file = nested / "module.py"
+    nested_file.write_text("nested")
+    cache_file = project_dir / "src" / "__pycache__" / "module.pyc"
+    cache_file.parent.mkdir()
+    cache_file.write_text("cache")
+
+    os.utime(project_dir / "top.txt", (1_000_000_000, 1_000_000_000))
+    os.utime(nested_file, (1_500_000_000, 1_500_000_000))
+    os.utime(cache_file, (1_700_000_000, 1_700_000_000))
+
+    assert get_last_file_modified_time(project_dir) == datetime.fromtimestamp(1_500_000_000)
+
+
+def test_get_last_file_modified_time_empty_directory(tmp_path):
+    """Test that a directory without files returns None."""
+    from project_database.scanner import get_last_file_modified_time
+
+    project_dir = tmp_path / "empty-project"
+    (project_dir / "subdir").mkdir(parents=True)
+
+    assert get_last_file_modified_time(project_dir) is None
+
+
+def test_parse_logseq_link_ignores_content_past_read_limit(tmp_path):
+    """Test that only the start of a very large Link.md is searched."""
+    link_file = tmp_path / "Link.md"
+    link_file.write_text(
+        "x" * 10_000 + "\n[logseq](logseq://graph/logseq-personal?page=late-link)"
+    )
+
+    assert parse_logseq_link(link_file) is None
+
 
-    time.sleep(0.1)
+def test_parsers_use_precompiled_regexes(logseq_link_file, monkeypatch):
+    """Test that parsing uses module-level compiled patterns, never the re module at call time."""
+    from project_database import scanner
 
-    # Create venv directory with a newer file (should be ignored)
-    venv_dir = project_dir / "venv"
-    venv_dir.mkdir()
-    venv_file = venv_dir / "newer.txt"
-    venv_file.write_text("newer in venv")
+    class NoRegexModule:
+        def __getattr__(self, name):
+            raise AssertionError(f"re.{name} called while parsing")
 
-    # Get the most recent modification time
-    last_modified = get_last_file_modified_time(project_dir)
+    monkeypatch.setattr(scanner, "re", NoRegexModule())
 
-    # Should return main_time, not the venv file time
-    assert last_modified is not None
-    assert abs((last_modified - main_time).total_seconds()) < 1  # Within 1 second
+    assert parse_logseq_link(logseq_link_file) == "project/project-database"
+    assert parse_logseq_link_from_text("no link") is None
+    # URLs not used elsewhere, so get_github_url's cache cannot answer for the regexes
+    assert get_github_url("https://github.com/romilly/compiled-once.git") == "https://github.com/romilly/compiled-once"
+    assert get_github_url("git@github.com:romilly/compiled-ssh.git") == "https://github.com/romilly/compiled-ssh"